@@ -40,12 +40,10 @@ from datetime import datetime
 from functools import wraps
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
-from urllib.request import urlopen
 
 # Third-party imports
 try:
     import pandas
-    from bs4 import BeautifulSoup
     from cryptography.fernet import Fernet, InvalidToken
     from selenium import webdriver
     from selenium.common.exceptions import (
@@ -1300,573 +1298,12 @@ class SeleniumEPlanExtractor:
 # GUI APPLICATION - MODERN PROFESSIONAL UI
 # =============================================================================
 
-class Theme:
-    """Modern color theme for the application."""
-
-    # Main colors
-    BG_PRIMARY = "#1a1a2e"      # Dark blue background
-    BG_SECONDARY = "#16213e"    # Slightly lighter background
-    BG_CARD = "#0f3460"         # Card background
-    BG_INPUT = "#1a1a2e"        # Input field background
-
-    # Accent colors
-    ACCENT_PRIMARY = "#e94560"   # Red/Pink accent
-    ACCENT_SECONDARY = "#0f3460" # Blue accent
-    ACCENT_SUCCESS = "#00d9a5"   # Green for success
-    ACCENT_WARNING = "#ffc107"   # Yellow for warnings
-    ACCENT_ERROR = "#ff4757"     # Red for errors
-
-    # Text colors
-    TEXT_PRIMARY = "#ffffff"     # White text
-    TEXT_SECONDARY = "#a0a0a0"   # Gray text
-    TEXT_MUTED = "#6c757d"       # Muted text
-
-    # Border colors
-    BORDER_COLOR = "#2d3748"     # Border color
-    BORDER_FOCUS = "#e94560"     # Border on focus
-
-    # Button colors
-    BTN_PRIMARY_BG = "#e94560"
-    BTN_PRIMARY_FG = "#ffffff"
-    BTN_SECONDARY_BG = "#0f3460"
-    BTN_SECONDARY_FG = "#ffffff"
-    BTN_DISABLED_BG = "#4a5568"
-    BTN_DISABLED_FG = "#718096"
-
-    # Status colors
-    STATUS_IDLE = "#6c757d"
-    STATUS_RUNNING = "#0ea5e9"
-    STATUS_SUCCESS = "#00d9a5"
-    STATUS_ERROR = "#ff4757"
-
-    # Fonts
-    FONT_FAMILY = "Segoe UI"
-    FONT_SIZE_TITLE = 24
-    FONT_SIZE_HEADING = 14
-    FONT_SIZE_BODY = 11
-    FONT_SIZE_SMALL = 9
-
-
-class ModernEntry(tk.Frame):
-    """Custom modern-styled entry widget."""
-
-    def __init__(
-        self,
-        parent: tk.Widget,
-        placeholder: str = "",
-        show: str = "",
-        textvariable: Optional[tk.StringVar] = None,
-        **kwargs
-    ) -> None:
-        super().__init__(parent, bg=Theme.BG_CARD)
-
-        self._placeholder = placeholder
-        self._show_char = show
-        self._has_focus = False
-
-        # Container frame with border effect
-        self._container = tk.Frame(
-            self,
-            bg=Theme.BORDER_COLOR,
-            padx=1,
-            pady=1
-        )
-        self._container.pack(fill="x", expand=True)
-
-        # Inner frame
-        self._inner = tk.Frame(self._container, bg=Theme.BG_INPUT)
-        self._inner.pack(fill="x", expand=True)
-
-        # Entry widget
-        self._entry = tk.Entry(
-            self._inner,
-            bg=Theme.BG_INPUT,
-            fg=Theme.TEXT_PRIMARY,
-            insertbackground=Theme.TEXT_PRIMARY,
-            relief="flat",
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY),
-            textvariable=textvariable,
-            show=show,
-            **kwargs
-        )
-        self._entry.pack(fill="x", padx=12, pady=10)
-
-        # Placeholder handling
-        if placeholder and not textvariable.get():
-            self._show_placeholder()
-
-        # Bindings
-        self._entry.bind("<FocusIn>", self._on_focus_in)
-        self._entry.bind("<FocusOut>", self._on_focus_out)
-
-    def _show_placeholder(self) -> None:
-        """Show placeholder text."""
-        self._entry.config(fg=Theme.TEXT_MUTED, show="")
-        self._entry.delete(0, "end")
-        self._entry.insert(0, self._placeholder)
-
-    def _hide_placeholder(self) -> None:
-        """Hide placeholder text."""
-        self._entry.config(fg=Theme.TEXT_PRIMARY, show=self._show_char)
-        if self._entry.get() == self._placeholder:
-            self._entry.delete(0, "end")
-
-    def _on_focus_in(self, event: tk.Event) -> None:
-        """Handle focus in event."""
-        self._has_focus = True
-        self._container.config(bg=Theme.BORDER_FOCUS)
-        if self._entry.get() == self._placeholder:
-            self._hide_placeholder()
-
-    def _on_focus_out(self, event: tk.Event) -> None:
-        """Handle focus out event."""
-        self._has_focus = False
-        self._container.config(bg=Theme.BORDER_COLOR)
-        if not self._entry.get():
-            self._show_placeholder()
-
-    def get(self) -> str:
-        """Get entry value."""
-        value = self._entry.get()
-        return "" if value == self._placeholder else value
-
-
-class ModernButton(tk.Canvas):
-    """Custom modern-styled button widget."""
-
-    def __init__(
-        self,
-        parent: tk.Widget,
-        text: str = "",
-        command: Optional[Callable] = None,
-        primary: bool = True,
-        width: int = 140,
-        height: int = 42,
-        **kwargs
-    ) -> None:
-        super().__init__(
-            parent,
-            width=width,
-            height=height,
-            bg=Theme.BG_CARD,
-            highlightthickness=0,
-            **kwargs
-        )
-
-        self._text = text
-        self._command = command
-        self._primary = primary
-        self._width = width
-        self._height = height
-        self._enabled = True
-        self._hovered = False
-
-        # Colors
-        if primary:
-            self._bg = Theme.BTN_PRIMARY_BG
-            self._fg = Theme.BTN_PRIMARY_FG
-            self._hover_bg = "#ff6b81"
-        else:
-            self._bg = Theme.BTN_SECONDARY_BG
-            self._fg = Theme.BTN_SECONDARY_FG
-            self._hover_bg = "#1a4a7a"
-
-        self._draw()
-
-        # Bindings
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
-        self.bind("<Button-1>", self._on_click)
-
-    def _draw(self) -> None:
-        """Draw the button."""
-        self.delete("all")
-
-        bg = self._bg if self._enabled else Theme.BTN_DISABLED_BG
-        fg = self._fg if self._enabled else Theme.BTN_DISABLED_FG
-
-        if self._hovered and self._enabled:
-            bg = self._hover_bg
-
-        # Draw rounded rectangle
-        radius = 8
-        self._round_rectangle(
-            2, 2, self._width - 2, self._height - 2,
-            radius=radius,
-            fill=bg,
-            outline=""
-        )
-
-        # Draw text
-        self.create_text(
-            self._width // 2,
-            self._height // 2,
-            text=self._text,
-            fill=fg,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY, "bold")
-        )
-
-    def _round_rectangle(
-        self,
-        x1: int, y1: int, x2: int, y2: int,
-        radius: int = 10,
-        **kwargs
-    ) -> int:
-        """Draw a rounded rectangle."""
-        points = [
-            x1 + radius, y1,
-            x2 - radius, y1,
-            x2, y1,
-            x2, y1 + radius,
-            x2, y2 - radius,
-            x2, y2,
-            x2 - radius, y2,
-            x1 + radius, y2,
-            x1, y2,
-            x1, y2 - radius,
-            x1, y1 + radius,
-            x1, y1,
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
-
-    def _on_enter(self, event: tk.Event) -> None:
-        """Handle mouse enter."""
-        if self._enabled:
-            self._hovered = True
-            self._draw()
-            self.config(cursor="hand2")
-
-    def _on_leave(self, event: tk.Event) -> None:
-        """Handle mouse leave."""
-        self._hovered = False
-        self._draw()
-        self.config(cursor="")
-
-    def _on_click(self, event: tk.Event) -> None:
-        """Handle click event."""
-        if self._enabled and self._command:
-            self._command()
-
-    def set_enabled(self, enabled: bool) -> None:
-        """Enable or disable the button."""
-        self._enabled = enabled
-        self._draw()
-
-    def set_text(self, text: str) -> None:
-        """Set button text."""
-        self._text = text
-        self._draw()
-
-
-class ModernCheckbox(tk.Frame):
-    """Custom modern-styled checkbox widget."""
-
-    def __init__(
-        self,
-        parent: tk.Widget,
-        text: str = "",
-        variable: Optional[tk.BooleanVar] = None,
-        **kwargs
-    ) -> None:
-        super().__init__(parent, bg=Theme.BG_CARD)
-
-        self._variable = variable or tk.BooleanVar()
-        self._text = text
-
-        # Checkbox canvas
-        self._canvas = tk.Canvas(
-            self,
-            width=20,
-            height=20,
-            bg=Theme.BG_CARD,
-            highlightthickness=0
-        )
-        self._canvas.pack(side="left", padx=(0, 8))
-
-        # Label
-        self._label = tk.Label(
-            self,
-            text=text,
-            bg=Theme.BG_CARD,
-            fg=Theme.TEXT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
-        )
-        self._label.pack(side="left")
-
-        self._draw()
-
-        # Bindings
-        self._canvas.bind("<Button-1>", self._toggle)
-        self._label.bind("<Button-1>", self._toggle)
-        self._variable.trace_add("write", lambda *args: self._draw())
-
-    def _draw(self) -> None:
-        """Draw the checkbox."""
-        self._canvas.delete("all")
-
-        # Draw box
-        self._canvas.create_rectangle(
-            2, 2, 18, 18,
-            outline=Theme.BORDER_COLOR,
-            fill=Theme.BG_INPUT,
-            width=2
-        )
-
-        # Draw checkmark if checked
-        if self._variable.get():
-            self._canvas.create_rectangle(
-                2, 2, 18, 18,
-                outline=Theme.ACCENT_PRIMARY,
-                fill=Theme.ACCENT_PRIMARY,
-                width=2
-            )
-            # Checkmark
-            self._canvas.create_line(
-                6, 10, 9, 14, 14, 6,
-                fill="white",
-                width=2,
-                capstyle="round",
-                joinstyle="round"
-            )
-
-    def _toggle(self, event: tk.Event) -> None:
-        """Toggle the checkbox."""
-        self._variable.set(not self._variable.get())
-
-
-class ProgressIndicator(tk.Canvas):
-    """Animated progress indicator with steps."""
-
-    STEPS = [
-        ("Login", "Authenticating with Microsoft"),
-        ("Project", "Opening project"),
-        ("Extract", "Extracting variables"),
-        ("Export", "Saving results")
-    ]
-
-    def __init__(self, parent: tk.Widget, **kwargs) -> None:
-        super().__init__(
-            parent,
-            height=80,
-            bg=Theme.BG_CARD,
-            highlightthickness=0,
-            **kwargs
-        )
-
-        self._current_step = -1
-        self._progress = 0.0
-        self._animation_id: Optional[str] = None
-
-        self.bind("<Configure>", lambda e: self._draw())
-
-    def _draw(self) -> None:
-        """Draw the progress indicator."""
-        self.delete("all")
-
-        width = self.winfo_width()
-        if width < 10:
-            return
-
-        step_count = len(self.STEPS)
-        step_width = (width - 40) / (step_count - 1)
-        y_line = 25
-        y_text = 55
-
-        # Draw connecting line (background)
-        self.create_line(
-            20, y_line, width - 20, y_line,
-            fill=Theme.BORDER_COLOR,
-            width=3,
-            capstyle="round"
-        )
-
-        # Draw progress line
-        if self._current_step >= 0:
-            progress_width = 20 + (self._current_step * step_width) + (self._progress * step_width)
-            progress_width = min(progress_width, width - 20)
-            self.create_line(
-                20, y_line, progress_width, y_line,
-                fill=Theme.ACCENT_PRIMARY,
-                width=3,
-                capstyle="round"
-            )
-
-        # Draw step circles and labels
-        for i, (name, desc) in enumerate(self.STEPS):
-            x = 20 + i * step_width
-
-            # Circle
-            if i < self._current_step:
-                # Completed
-                color = Theme.ACCENT_SUCCESS
-                text_color = Theme.TEXT_PRIMARY
-            elif i == self._current_step:
-                # Current
-                color = Theme.ACCENT_PRIMARY
-                text_color = Theme.TEXT_PRIMARY
-            else:
-                # Pending
-                color = Theme.BORDER_COLOR
-                text_color = Theme.TEXT_MUTED
-
-            self.create_oval(
-                x - 12, y_line - 12, x + 12, y_line + 12,
-                fill=color,
-                outline=""
-            )
-
-            # Step number or checkmark
-            if i < self._current_step:
-                self.create_text(x, y_line, text="✓", fill="white", font=(Theme.FONT_FAMILY, 10, "bold"))
-            else:
-                self.create_text(x, y_line, text=str(i + 1), fill="white", font=(Theme.FONT_FAMILY, 10, "bold"))
-
-            # Label
-            self.create_text(
-                x, y_text,
-                text=name,
-                fill=text_color,
-                font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL)
-            )
-
-    def set_step(self, step: int, progress: float = 0.0) -> None:
-        """Set the current step and progress."""
-        self._current_step = step
-        self._progress = max(0.0, min(1.0, progress))
-        self._draw()
-
-    def reset(self) -> None:
-        """Reset the progress indicator."""
-        self._current_step = -1
-        self._progress = 0.0
-        self._draw()
-
-
-class StatusBar(tk.Frame):
-    """Modern status bar with icon and message."""
-
-    def __init__(self, parent: tk.Widget, **kwargs) -> None:
-        super().__init__(parent, bg=Theme.BG_SECONDARY, **kwargs)
-
-        # Status icon
-        self._icon_label = tk.Label(
-            self,
-            text="●",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.STATUS_IDLE,
-            font=(Theme.FONT_FAMILY, 12)
-        )
-        self._icon_label.pack(side="left", padx=(15, 8), pady=10)
-
-        # Status text
-        self._text_label = tk.Label(
-            self,
-            text="Ready",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_SECONDARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY),
-            anchor="w"
-        )
-        self._text_label.pack(side="left", fill="x", expand=True, pady=10)
-
-        # Version
-        self._version_label = tk.Label(
-            self,
-            text=f"v{VERSION}",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_MUTED,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL)
-        )
-        self._version_label.pack(side="right", padx=15, pady=10)
-
-    def set_status(self, message: str, status: str = "idle") -> None:
-        """Set status message and state."""
-        self._text_label.config(text=message)
-
-        colors = {
-            "idle": Theme.STATUS_IDLE,
-            "running": Theme.STATUS_RUNNING,
-            "success": Theme.STATUS_SUCCESS,
-            "error": Theme.STATUS_ERROR
-        }
-        self._icon_label.config(fg=colors.get(status, Theme.STATUS_IDLE))
-
-
-class LogPanel(tk.Frame):
-    """Modern log panel with colored output."""
-
-    def __init__(self, parent: tk.Widget, **kwargs) -> None:
-        super().__init__(parent, bg=Theme.BG_SECONDARY, **kwargs)
-
-        # Header
-        header = tk.Frame(self, bg=Theme.BG_SECONDARY)
-        header.pack(fill="x", padx=15, pady=(15, 10))
-
-        tk.Label(
-            header,
-            text="Activity Log",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_HEADING, "bold")
-        ).pack(side="left")
-
-        # Clear button
-        clear_btn = tk.Label(
-            header,
-            text="Clear",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_MUTED,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL),
-            cursor="hand2"
-        )
-        clear_btn.pack(side="right")
-        clear_btn.bind("<Button-1>", lambda e: self.clear())
-        clear_btn.bind("<Enter>", lambda e: clear_btn.config(fg=Theme.TEXT_PRIMARY))
-        clear_btn.bind("<Leave>", lambda e: clear_btn.config(fg=Theme.TEXT_MUTED))
-
-        # Log text area
-        self._text = tk.Text(
-            self,
-            bg=Theme.BG_PRIMARY,
-            fg=Theme.TEXT_SECONDARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL),
-            relief="flat",
-            padx=15,
-            pady=10,
-            wrap="word",
-            state="disabled"
-        )
-        self._text.pack(fill="both", expand=True, padx=15, pady=(0, 15))
-
-        # Configure tags for colored output
-        self._text.tag_configure("timestamp", foreground=Theme.TEXT_MUTED)
-        self._text.tag_configure("DEBUG", foreground=Theme.TEXT_MUTED)
-        self._text.tag_configure("INFO", foreground=Theme.TEXT_SECONDARY)
-        self._text.tag_configure("WARNING", foreground=Theme.ACCENT_WARNING)
-        self._text.tag_configure("ERROR", foreground=Theme.ACCENT_ERROR)
-        self._text.tag_configure("SUCCESS", foreground=Theme.ACCENT_SUCCESS)
-
-        # Scrollbar
-        scrollbar = tk.Scrollbar(self._text, command=self._text.yview)
-        scrollbar.pack(side="right", fill="y")
-        self._text.config(yscrollcommand=scrollbar.set)
-
-    def log(self, message: str, level: str = "INFO") -> None:
-        """Add a log message."""
-        self._text.config(state="normal")
-
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self._text.insert("end", f"[{timestamp}] ", "timestamp")
-        self._text.insert("end", f"{message}\n", level)
-
-        self._text.see("end")
-        self._text.config(state="disabled")
-
-    def clear(self) -> None:
-        """Clear the log."""
-        self._text.config(state="normal")
-        self._text.delete("1.0", "end")
-        self._text.config(state="disabled")
+# Theme, panels and widgets are shared with the eplan_extractor package (and
+# its palette). They need tkinter, so CLI-only runs without Tk skip them.
+if GUI_AVAILABLE:
+    from eplan_extractor.gui.theme import Theme, get_palette
+    from eplan_extractor.gui.panels import LogPanel, ProgressIndicator, StatusBar
+    from eplan_extractor.gui.widgets import ModernButton, ModernCheckbox, ModernEntry, PasswordEntry
 
 
 class EPlanExtractorGUI:
@@ -1887,7 +1324,7 @@ class EPlanExtractorGUI:
         self.root.title("EPLAN eVIEW Extractor")
         self.root.geometry("700x800")
         self.root.minsize(600, 700)
-        self.root.configure(bg=Theme.BG_PRIMARY)
+        self.root.configure(bg=get_palette().BG_PRIMARY)
 
         # Try to set window icon (if available)
         try:
@@ -1918,15 +1355,16 @@ class EPlanExtractorGUI:
 
     def _setup_ui(self) -> None:
         """Set up the modern user interface."""
+        p = get_palette()
         # Main container
-        main_container = tk.Frame(self.root, bg=Theme.BG_PRIMARY)
+        main_container = tk.Frame(self.root, bg=p.BG_PRIMARY)
         main_container.pack(fill="both", expand=True)
 
         # Header
         self._create_header(main_container)
 
         # Content area with scrolling
-        content_frame = tk.Frame(main_container, bg=Theme.BG_PRIMARY)
+        content_frame = tk.Frame(main_container, bg=p.BG_PRIMARY)
         content_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
         # Credentials Card
@@ -1950,74 +1388,77 @@ class EPlanExtractorGUI:
 
     def _create_header(self, parent: tk.Widget) -> None:
         """Create the header section."""
-        header = tk.Frame(parent, bg=Theme.BG_PRIMARY)
+        p = get_palette()
+        header = tk.Frame(parent, bg=p.BG_PRIMARY)
         header.pack(fill="x", padx=20, pady=(20, 10))
 
         # Logo/Title
-        title_frame = tk.Frame(header, bg=Theme.BG_PRIMARY)
+        title_frame = tk.Frame(header, bg=p.BG_PRIMARY)
         title_frame.pack(side="left")
 
         tk.Label(
             title_frame,
             text="EPLAN",
-            bg=Theme.BG_PRIMARY,
-            fg=Theme.ACCENT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_TITLE, "bold")
+            bg=p.BG_PRIMARY,
+            fg=p.ACCENT_PRIMARY,
+            font=Theme.FONT_TITLE_BOLD
         ).pack(side="left")
 
         tk.Label(
             title_frame,
             text=" eVIEW Extractor",
-            bg=Theme.BG_PRIMARY,
-            fg=Theme.TEXT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_TITLE)
+            bg=p.BG_PRIMARY,
+            fg=p.TEXT_PRIMARY,
+            font=Theme.FONT_TITLE
         ).pack(side="left")
 
-        # Settings button (placeholder)
+        # Settings button (placeholder, plain text like the package app)
         settings_btn = tk.Label(
             header,
-            text="⚙",
-            bg=Theme.BG_PRIMARY,
-            fg=Theme.TEXT_MUTED,
-            font=(Theme.FONT_FAMILY, 18),
+            text="Settings",
+            bg=p.BG_PRIMARY,
+            fg=p.TEXT_MUTED,
+            font=Theme.FONT_BODY,
             cursor="hand2"
         )
         settings_btn.pack(side="right", padx=10)
-        settings_btn.bind("<Enter>", lambda e: settings_btn.config(fg=Theme.TEXT_PRIMARY))
-        settings_btn.bind("<Leave>", lambda e: settings_btn.config(fg=Theme.TEXT_MUTED))
+        settings_btn.bind("<Enter>", lambda e: settings_btn.config(fg=get_palette().TEXT_PRIMARY))
+        settings_btn.bind("<Leave>", lambda e: settings_btn.config(fg=get_palette().TEXT_MUTED))
         settings_btn.bind("<Button-1>", lambda e: self._show_settings())
 
     def _create_card(self, parent: tk.Widget, title: str) -> tk.Frame:
         """Create a card container."""
-        card = tk.Frame(parent, bg=Theme.BG_CARD)
+        p = get_palette()
+        card = tk.Frame(parent, bg=p.BG_CARD)
         card.pack(fill="x", pady=8)
 
         # Title
         tk.Label(
             card,
             text=title,
-            bg=Theme.BG_CARD,
-            fg=Theme.TEXT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_HEADING, "bold")
+            bg=p.BG_CARD,
+            fg=p.TEXT_PRIMARY,
+            font=Theme.FONT_HEADING_BOLD
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
         # Content frame
-        content = tk.Frame(card, bg=Theme.BG_CARD)
+        content = tk.Frame(card, bg=p.BG_CARD)
         content.pack(fill="x", padx=20, pady=(0, 15))
 
         return content
 
     def _create_credentials_card(self, parent: tk.Widget) -> None:
         """Create the credentials input card."""
+        p = get_palette()
         content = self._create_card(parent, "Microsoft Credentials")
 
         # Email
         tk.Label(
             content,
             text="Email Address",
-            bg=Theme.BG_CARD,
-            fg=Theme.TEXT_SECONDARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL)
+            bg=p.BG_CARD,
+            fg=p.TEXT_SECONDARY,
+            font=Theme.FONT_SMALL
         ).pack(anchor="w", pady=(0, 5))
 
         self._email_entry = ModernEntry(
@@ -2031,15 +1472,14 @@ class EPlanExtractorGUI:
         tk.Label(
             content,
             text="Password",
-            bg=Theme.BG_CARD,
-            fg=Theme.TEXT_SECONDARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL)
+            bg=p.BG_CARD,
+            fg=p.TEXT_SECONDARY,
+            font=Theme.FONT_SMALL
         ).pack(anchor="w", pady=(0, 5))
 
-        self._password_entry = ModernEntry(
+        self._password_entry = PasswordEntry(
             content,
             placeholder="Enter your password",
-            show="●",
             textvariable=self._password_var
         )
         self._password_entry.pack(fill="x", pady=(0, 15))
@@ -2048,9 +1488,9 @@ class EPlanExtractorGUI:
         tk.Label(
             content,
             text="Project Number",
-            bg=Theme.BG_CARD,
-            fg=Theme.TEXT_SECONDARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL)
+            bg=p.BG_CARD,
+            fg=p.TEXT_SECONDARY,
+            font=Theme.FONT_SMALL
         ).pack(anchor="w", pady=(0, 5))
 
         self._project_entry = ModernEntry(
@@ -2062,13 +1502,14 @@ class EPlanExtractorGUI:
 
     def _create_options_card(self, parent: tk.Widget) -> None:
         """Create the options card."""
+        p = get_palette()
         content = self._create_card(parent, "Export Options")
 
-        options_grid = tk.Frame(content, bg=Theme.BG_CARD)
+        options_grid = tk.Frame(content, bg=p.BG_CARD)
         options_grid.pack(fill="x")
 
         # Left column
-        left_col = tk.Frame(options_grid, bg=Theme.BG_CARD)
+        left_col = tk.Frame(options_grid, bg=p.BG_CARD)
         left_col.pack(side="left", fill="x", expand=True)
 
         ModernCheckbox(
@@ -2084,7 +1525,7 @@ class EPlanExtractorGUI:
         ).pack(anchor="w", pady=3)
 
         # Right column
-        right_col = tk.Frame(options_grid, bg=Theme.BG_CARD)
+        right_col = tk.Frame(options_grid, bg=p.BG_CARD)
         right_col.pack(side="right", fill="x", expand=True)
 
         ModernCheckbox(
@@ -2095,15 +1536,16 @@ class EPlanExtractorGUI:
 
     def _create_progress_card(self, parent: tk.Widget) -> None:
         """Create the progress indicator card."""
-        card = tk.Frame(parent, bg=Theme.BG_CARD)
+        p = get_palette()
+        card = tk.Frame(parent, bg=p.BG_CARD)
         card.pack(fill="x", pady=8)
 
         tk.Label(
             card,
             text="Extraction Progress",
-            bg=Theme.BG_CARD,
-            fg=Theme.TEXT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_HEADING, "bold")
+            bg=p.BG_CARD,
+            fg=p.TEXT_PRIMARY,
+            font=Theme.FONT_HEADING_BOLD
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
         self._progress_indicator = ProgressIndicator(card)
@@ -2111,11 +1553,12 @@ class EPlanExtractorGUI:
 
     def _create_action_buttons(self, parent: tk.Widget) -> None:
         """Create action buttons."""
-        button_frame = tk.Frame(parent, bg=Theme.BG_PRIMARY)
+        p = get_palette()
+        button_frame = tk.Frame(parent, bg=p.BG_PRIMARY)
         button_frame.pack(fill="x", pady=15)
 
         # Center the buttons
-        inner_frame = tk.Frame(button_frame, bg=Theme.BG_PRIMARY)
+        inner_frame = tk.Frame(button_frame, bg=p.BG_PRIMARY)
         inner_frame.pack()
 
         self._start_button = ModernButton(
@@ -2123,7 +1566,8 @@ class EPlanExtractorGUI:
             text="Start Extraction",
             command=self._start_extraction,
             primary=True,
-            width=160
+            width=160,
+            height=42
         )
         self._start_button.pack(side="left", padx=5)
 
@@ -2132,7 +1576,8 @@ class EPlanExtractorGUI:
             text="Stop",
             command=self._stop_extraction,
             primary=False,
-            width=100
+            width=100,
+            height=42
         )
         self._stop_button.pack(side="left", padx=5)
         self._stop_button.set_enabled(False)
@@ -2144,11 +1589,12 @@ class EPlanExtractorGUI:
 
     def _show_settings(self) -> None:
         """Show settings dialog."""
+        p = get_palette()
         # Create settings window
         settings_win = tk.Toplevel(self.root)
         settings_win.title("Settings")
         settings_win.geometry("400x300")
-        settings_win.configure(bg=Theme.BG_PRIMARY)
+        settings_win.configure(bg=p.BG_PRIMARY)
         settings_win.transient(self.root)
         settings_win.grab_set()
 
@@ -2156,29 +1602,29 @@ class EPlanExtractorGUI:
         tk.Label(
             settings_win,
             text="Settings",
-            bg=Theme.BG_PRIMARY,
-            fg=Theme.TEXT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_HEADING, "bold")
+            bg=p.BG_PRIMARY,
+            fg=p.TEXT_PRIMARY,
+            font=Theme.FONT_HEADING_BOLD
         ).pack(pady=20)
 
         # Cache section
-        cache_frame = tk.Frame(settings_win, bg=Theme.BG_CARD)
+        cache_frame = tk.Frame(settings_win, bg=p.BG_CARD)
         cache_frame.pack(fill="x", padx=20, pady=10)
 
         tk.Label(
             cache_frame,
             text="Cache Management",
-            bg=Theme.BG_CARD,
-            fg=Theme.TEXT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY, "bold")
+            bg=p.BG_CARD,
+            fg=p.TEXT_PRIMARY,
+            font=Theme.FONT_BODY_BOLD
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         tk.Label(
             cache_frame,
             text="Clear cached extraction data to force re-extraction",
-            bg=Theme.BG_CARD,
-            fg=Theme.TEXT_MUTED,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL)
+            bg=p.BG_CARD,
+            fg=p.TEXT_MUTED,
+            font=Theme.FONT_SMALL
         ).pack(anchor="w", padx=15, pady=(0, 10))
 
         clear_cache_btn = ModernButton(
@@ -2186,7 +1632,8 @@ class EPlanExtractorGUI:
             text="Clear Cache",
             command=lambda: self._clear_cache_action(settings_win),
             primary=False,
-            width=120
+            width=120,
+            height=42
         )
         clear_cache_btn.pack(anchor="w", padx=15, pady=(0, 15))
 
@@ -2560,35 +2007,6 @@ def run_tests() -> bool:
         return False
 
 
-# =============================================================================
-# UTILITY FUNCTIONS
-# =============================================================================
-
-def print_from_link(url: str) -> None:
-    """
-    Extract and print text content from a URL.
-
-    Args:
-        url: URL to fetch and parse
-    """
-    html = urlopen(url).read()
-    soup = BeautifulSoup(html, features="html.parser")
-
-    # Remove script and style elements
-    for element in soup(["script", "style"]):
-        element.extract()
-
-    # Get text
-    text = soup.get_text()
-
-    # Clean up whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = "\n".join(chunk for chunk in chunks if chunk)
-
-    print(text)
-
-
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
@@ -29,6 +29,7 @@ DEBUG: bool = True
 MAX_RETRIES: int = 3
 RETRY_BASE_DELAY: float = 2.0  # seconds
 RETRY_MAX_DELAY: float = 30.0  # seconds
+RETRY_JITTER: float = 0.5  # fraction of each delay that is randomized
 
 # =============================================================================
 # CACHE CONFIGURATION
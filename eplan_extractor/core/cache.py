@@ -12,6 +12,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 from ..constants import CACHE_ENABLED, CACHE_FILE, CACHE_TTL_HOURS, CacheEntry, ExtractedData
 from ..utils.logging import get_logger
 
@@ -40,9 +45,9 @@ class CacheManager:
 
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self._cache = json.load(f)
-                get_logger().debug(f"Loaded {len(self._cache)} cache entries")
+                raw = self.cache_file.read_bytes()
+                self._cache = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+                get_logger().debug("Loaded %d cache entries", len(self._cache))
         except (json.JSONDecodeError, IOError) as e:
             get_logger().warning(f"Failed to load cache: {e}")
             self._cache = {}
@@ -53,8 +58,14 @@ class CacheManager:
             return
 
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self._cache, f, indent=2)
+            # Compact and UTF-8: the file is machine-read only
+            if _orjson is not None:
+                raw = _orjson.dumps(self._cache)
+            else:
+                raw = json.dumps(
+                    self._cache, separators=(",", ":"), ensure_ascii=False
+                ).encode("utf-8")
+            self.cache_file.write_bytes(raw)
         except IOError as e:
             get_logger().warning(f"Failed to save cache: {e}")
 
@@ -91,7 +102,7 @@ class CacheManager:
             entry = self._cache.get(key)
 
             if entry and self._is_entry_valid(entry):
-                get_logger().debug(f"Cache hit for page: {page_name}")
+                get_logger().debug("Cache hit for page: %s", page_name)
                 return entry.get("data")
 
             return None
@@ -117,7 +128,7 @@ class CacheManager:
                 "data": data
             }
             self._save_cache()
-            get_logger().debug(f"Cached data for page: {page_name}")
+            get_logger().debug("Cached data for page: %s", page_name)
 
     def clear(self, project: Optional[str] = None) -> int:
         """
@@ -134,14 +145,15 @@ class CacheManager:
                 count = len(self._cache)
                 self._cache = {}
             else:
-                keys_to_remove = [
-                    k for k, v in self._cache.items()
-                    if v.get("project") == project
-                ]
-                count = len(keys_to_remove)
-                for key in keys_to_remove:
-                    del self._cache[key]
-
+                # One pass that keeps the other projects' entries
+                kept = {
+                    k: v for k, v in self._cache.items()
+                    if v.get("project") != project
+                }
+                count = len(self._cache) - len(kept)
+                self._cache = kept
+
+            # One write for the whole batch
             self._save_cache()
             get_logger().info(f"Cleared {count} cache entries")
             return count
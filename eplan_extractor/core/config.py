@@ -6,15 +6,42 @@ from __future__ import annotations
 
 import base64
 import json
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional
 
 from cryptography.fernet import Fernet, InvalidToken
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 from ..utils.logging import get_logger
 
+# Whitespace and commas between the objects of the history array
+_HISTORY_SEPARATOR_RE = re.compile(r"[\s,]*")
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    raw = path.read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, with orjson when it is installed."""
+    if _orjson is not None:
+        raw = _orjson.dumps(data, option=_orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, indent=2).encode("utf-8")
+    path.write_bytes(raw)
+
 
 @dataclass
 class AppConfig:
@@ -150,8 +177,7 @@ class ConfigManager:
             return self._config
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(config_path)
 
             self._config = AppConfig(
                 email=data.get("email", ""),
@@ -215,8 +241,7 @@ class ConfigManager:
                 "recent_projects": config.recent_projects[:self.MAX_RECENT_PROJECTS]
             }
 
-            with open(self.CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            _write_json(Path(self.CONFIG_FILE), data)
 
             self._config = config
             self._logger.info("Configuration saved successfully")
@@ -260,22 +285,9 @@ class ConfigManager:
             return []
 
         try:
-            with open(history_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            self._history = [
-                ExtractionRecord(
-                    project=entry.get("project", ""),
-                    timestamp=entry.get("timestamp", ""),
-                    duration_seconds=entry.get("duration_seconds", 0),
-                    pages_extracted=entry.get("pages_extracted", 0),
-                    variables_found=entry.get("variables_found", 0),
-                    output_file=entry.get("output_file", ""),
-                    success=entry.get("success", False),
-                    error_message=entry.get("error_message", "")
-                )
-                for entry in data
-            ]
+            data = _read_json(history_path)
+
+            self._history = [self._record_from_entry(entry) for entry in data]
 
             return self._history
 
@@ -283,6 +295,67 @@ class ConfigManager:
             self._logger.error(f"Failed to load history: {e}")
             return []
 
+    @staticmethod
+    def _record_from_entry(entry: dict) -> ExtractionRecord:
+        """Build a record from one entry of the history file."""
+        return ExtractionRecord(
+            project=entry.get("project", ""),
+            timestamp=entry.get("timestamp", ""),
+            duration_seconds=entry.get("duration_seconds", 0),
+            pages_extracted=entry.get("pages_extracted", 0),
+            variables_found=entry.get("variables_found", 0),
+            output_file=entry.get("output_file", ""),
+            success=entry.get("success", False),
+            error_message=entry.get("error_message", "")
+        )
+
+    def iter_history(self, limit: Optional[int] = None) -> Iterator[ExtractionRecord]:
+        """
+        Iterate over extraction history, newest first.
+
+        When the history is not loaded yet, entries are decoded from the
+        file one at a time and decoding stops after ``limit`` records.
+
+        Args:
+            limit: Maximum number of records to yield (None for all)
+
+        Yields:
+            Extraction records
+        """
+        if self._history:
+            yield from islice(self._history, limit)
+            return
+
+        history_path = Path(self.HISTORY_FILE)
+
+        if not history_path.exists():
+            return
+
+        try:
+            text = history_path.read_text(encoding="utf-8")
+        except IOError as e:
+            self._logger.error(f"Failed to load history: {e}")
+            return
+
+        decoder = json.JSONDecoder()
+        pos = _HISTORY_SEPARATOR_RE.match(text).end()
+        if not text.startswith("[", pos):
+            return
+        pos += 1
+
+        count = 0
+        while limit is None or count < limit:
+            pos = _HISTORY_SEPARATOR_RE.match(text, pos).end()
+            if pos >= len(text) or text[pos] == "]":
+                return
+            try:
+                entry, pos = decoder.raw_decode(text, pos)
+            except json.JSONDecodeError as e:
+                self._logger.error(f"Failed to load history: {e}")
+                return
+            yield self._record_from_entry(entry)
+            count += 1
+
     def add_history_entry(self, record: ExtractionRecord) -> None:
         """Add an extraction record to history."""
         self._history.insert(0, record)
@@ -310,8 +383,7 @@ class ConfigManager:
                 for record in self._history
             ]
 
-            with open(self.HISTORY_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            _write_json(Path(self.HISTORY_FILE), data)
 
             return True
 
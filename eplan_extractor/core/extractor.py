@@ -5,14 +5,18 @@ Web automation for extracting data from EPLAN eVIEW.
 from __future__ import annotations
 
 import re
+import threading
 import time
+from dataclasses import dataclass
 from typing import List, Optional
 
 import pandas
 from selenium import webdriver
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
+    InvalidArgumentException,
     NoSuchElementException,
+    SessionNotCreatedException,
     StaleElementReferenceException,
     TimeoutException,
     WebDriverException,
@@ -28,6 +32,15 @@ from ..utils.retry import retry_with_backoff
 from .cache import CacheManager
 
 
+@dataclass(slots=True)
+class ExtractionStats:
+    """Summary of a finished extract_variables() run."""
+
+    pages: int = 0
+    variables: int = 0
+    output_file: str = ""
+
+
 class SeleniumEPlanExtractor:
     """
     Handles web automation for extracting data from EPLAN eVIEW.
@@ -74,6 +87,8 @@ class SeleniumEPlanExtractor:
     ]
 
     ADDRESS_PATTERN: str = r"\b([IQ]W?\d+\.\d+|[IQ]W\d+)\b"
+    # Compiled once for the class and shared by every instance and caller
+    ADDRESS_PATTERN_RE: re.Pattern[str] = re.compile(ADDRESS_PATTERN)
 
     def __init__(
         self,
@@ -104,8 +119,8 @@ class SeleniumEPlanExtractor:
 
         self._logger = get_logger()
         self._driver: Optional[webdriver.Chrome] = None
-        self._address_regex = re.compile(self.ADDRESS_PATTERN)
-        self._stop_requested = False
+        # Set by request_stop(); also wakes retry backoff waits immediately
+        self.stop_event = threading.Event()
 
     @property
     def driver(self) -> Optional[webdriver.Chrome]:
@@ -114,16 +129,19 @@ class SeleniumEPlanExtractor:
 
     def request_stop(self) -> None:
         """Request the extraction to stop."""
-        self._stop_requested = True
+        self.stop_event.set()
         self._logger.warning("Stop requested")
 
     def _check_stop(self) -> bool:
         """Check if stop was requested."""
-        return self._stop_requested
+        return self.stop_event.is_set()
 
     @retry_with_backoff(
         max_retries=MAX_RETRIES,
-        exceptions=(WebDriverException, TimeoutException)
+        exceptions=(WebDriverException, TimeoutException),
+        # Driver/browser version mismatch or bad options won't fix themselves
+        non_retryable=(SessionNotCreatedException, InvalidArgumentException),
+        cancel_event=lambda self, *args, **kwargs: self.stop_event
     )
     def setup_driver(self) -> None:
         """Initialize the Chrome WebDriver with retry support."""
@@ -189,13 +207,13 @@ class SeleniumEPlanExtractor:
                 try:
                     element = self._driver.find_element(by, selector)
                     if element.is_displayed():
-                        self._logger.debug(f"Element found with selector: {selector}")
+                        self._logger.debug("Element found with selector: %s", selector)
                         return element
                 except NoSuchElementException:
                     continue
 
             time.sleep(1)
-            self._logger.debug(f"Waiting for element... [{attempt + 1}/{timeout}]")
+            self._logger.debug("Waiting for element... [%d/%d]", attempt + 1, timeout)
 
         return None
 
@@ -223,13 +241,15 @@ class SeleniumEPlanExtractor:
         except StaleElementReferenceException:
             self._logger.warning("Element became stale")
         except Exception as e:
-            self._logger.debug(f"Click failed: {e}")
+            self._logger.debug("Click failed: %s", e)
 
         return False
 
     @retry_with_backoff(
         max_retries=2,
-        exceptions=(WebDriverException, TimeoutException)
+        exceptions=(WebDriverException, TimeoutException),
+        non_retryable=(InvalidArgumentException,),  # Malformed base URL
+        cancel_event=lambda self, *args, **kwargs: self.stop_event
     )
     def click_on_login_with_microsoft(self) -> bool:
         """
@@ -508,7 +528,7 @@ class SeleniumEPlanExtractor:
                     # Check if row contains an address
                     text_objects = row.find_elements(By.TAG_NAME, "text")
                     has_address = any(
-                        self._address_regex.search(t.text)
+                        self.ADDRESS_PATTERN_RE.search(t.text)
                         for t in text_objects
                         if t.text
                     )
@@ -525,7 +545,8 @@ class SeleniumEPlanExtractor:
                         if not text or text.startswith("=") or text.startswith(":"):
                             continue
 
-                        if re.match(self.ADDRESS_PATTERN, text):
+                        # Every address starts with I or Q; skip the regex otherwise
+                        if text[0] in "IQ" and self.ADDRESS_PATTERN_RE.match(text):
                             key = text
                         else:
                             value = text
@@ -541,15 +562,15 @@ class SeleniumEPlanExtractor:
 
         return extracted
 
-    def extract_variables(self) -> bool:
+    def extract_variables(self) -> Optional[ExtractionStats]:
         """
         Extract variables from all PLC diagram pages.
 
         Returns:
-            True if extraction successful
+            Page/variable counts and the output file, or None if extraction failed
         """
         if not self._driver:
-            return False
+            return None
 
         try:
             scroll_container = self._driver.find_element(
@@ -557,7 +578,7 @@ class SeleniumEPlanExtractor:
             )
         except NoSuchElementException:
             self._logger.error("Scroll container not found")
-            return False
+            return None
 
         # Scroll to top
         self._driver.execute_script(
@@ -626,7 +647,7 @@ class SeleniumEPlanExtractor:
                 except ElementClickInterceptedException:
                     self._logger.warning("Click intercepted, skipping...")
                 except Exception as e:
-                    self._logger.debug(f"Error processing page: {e}")
+                    self._logger.debug("Error processing page: %s", e)
 
             # Scroll down
             self._driver.execute_script(
@@ -657,7 +678,11 @@ class SeleniumEPlanExtractor:
         df.to_excel(output_file, index=False)
 
         self._logger.success(f"Results saved to: {output_file}")
-        return True
+        return ExtractionStats(
+            pages=len(extracted_pages),
+            variables=len(flat_data),
+            output_file=output_file
+        )
 
     def run_extraction(self) -> bool:
         """
@@ -666,7 +691,7 @@ class SeleniumEPlanExtractor:
         Returns:
             True if extraction completed successfully
         """
-        self._stop_requested = False
+        self.stop_event.clear()
 
         try:
             self.setup_driver()
@@ -698,7 +723,7 @@ class SeleniumEPlanExtractor:
             if self._check_stop():
                 return False
 
-            if not self.extract_variables():
+            if self.extract_variables() is None:
                 raise Exception("Failed to extract variables")
 
             return True
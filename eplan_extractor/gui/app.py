@@ -8,6 +8,7 @@ import re
 import threading
 import time
 import tkinter as tk
+from concurrent.futures import CancelledError
 from datetime import datetime
 from tkinter import messagebox, ttk
 from typing import Optional
@@ -21,7 +22,7 @@ from ..utils.logging import get_logger
 from ..utils.i18n import I18n
 from ..utils.notifications import NotificationManager
 from .panels import LogPanel, ProgressIndicator, StatusBar
-from .theme import Theme
+from .theme import Theme, get_palette
 from .tray import SystemTray
 from .widgets import ModernButton, ModernCheckbox, ModernEntry, PasswordEntry, ThemeToggle
 
@@ -41,7 +42,8 @@ class EPlanExtractorGUI:
         self.root.title("EPLAN eVIEW Extractor")
         self.root.geometry("600x700")
         self.root.minsize(480, 550)
-        self.root.configure(bg=Theme.get_color("BG_PRIMARY"))
+        self.root.configure(bg=get_palette().BG_PRIMARY)
+        Theme.bind_root(self.root)
 
         self._logger = get_logger()
         self._config_manager = ConfigManager()
@@ -93,8 +95,9 @@ class EPlanExtractorGUI:
         self.root.bind("<Control-q>", lambda e: self._quit_app())
 
     def _setup_ui(self) -> None:
+        p = get_palette()
         # Main container that fills window
-        self._main = tk.Frame(self.root, bg=Theme.get_color("BG_PRIMARY"))
+        self._main = tk.Frame(self.root, bg=p.BG_PRIMARY)
         self._main.pack(fill="both", expand=True)
 
         # Configure grid weights for proper scaling
@@ -114,31 +117,33 @@ class EPlanExtractorGUI:
         self._status_bar.grid(row=2, column=0, sticky="ew")
 
     def _create_header(self) -> None:
-        header = tk.Frame(self._main, bg=Theme.get_color("BG_PRIMARY"))
+        p = get_palette()
+        header = tk.Frame(self._main, bg=p.BG_PRIMARY)
         header.grid(row=0, column=0, sticky="ew", padx=32, pady=(24, 16))
 
         tk.Label(
             header, text="EPLAN eVIEW Extractor",
-            bg=Theme.get_color("BG_PRIMARY"),
-            fg=Theme.get_color("TEXT_PRIMARY"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_TITLE, "bold")
+            bg=p.BG_PRIMARY,
+            fg=p.TEXT_PRIMARY,
+            font=Theme.FONT_TITLE_BOLD
         ).pack(side="left")
 
         settings_btn = tk.Label(
             header, text="Settings",
-            bg=Theme.get_color("BG_PRIMARY"),
-            fg=Theme.get_color("TEXT_MUTED"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY),
+            bg=p.BG_PRIMARY,
+            fg=p.TEXT_MUTED,
+            font=Theme.FONT_BODY,
             cursor="hand2"
         )
         settings_btn.pack(side="right")
         settings_btn.bind("<Button-1>", lambda e: self._show_settings())
-        settings_btn.bind("<Enter>", lambda e: settings_btn.config(fg=Theme.get_color("TEXT_PRIMARY")))
-        settings_btn.bind("<Leave>", lambda e: settings_btn.config(fg=Theme.get_color("TEXT_MUTED")))
+        settings_btn.bind("<Enter>", lambda e: settings_btn.config(fg=get_palette().TEXT_PRIMARY))
+        settings_btn.bind("<Leave>", lambda e: settings_btn.config(fg=get_palette().TEXT_MUTED))
 
     def _create_content_area(self) -> None:
+        p = get_palette()
         # Container for centering content
-        container = tk.Frame(self._main, bg=Theme.get_color("BG_PRIMARY"))
+        container = tk.Frame(self._main, bg=p.BG_PRIMARY)
         container.grid(row=1, column=0, sticky="nsew")
         container.grid_columnconfigure(0, weight=1)
         container.grid_columnconfigure(1, weight=0, minsize=0)
@@ -146,7 +151,7 @@ class EPlanExtractorGUI:
         container.grid_rowconfigure(0, weight=1)
 
         # Center column with max width
-        self._content = tk.Frame(container, bg=Theme.get_color("BG_PRIMARY"))
+        self._content = tk.Frame(container, bg=p.BG_PRIMARY)
         self._content.grid(row=0, column=1, sticky="ns", padx=32)
 
         # Bind resize to limit width
@@ -164,10 +169,11 @@ class EPlanExtractorGUI:
         self._content.config(width=width)
 
     def _create_form(self) -> None:
-        card = tk.Frame(self._content, bg=Theme.get_color("BG_CARD"))
+        p = get_palette()
+        card = tk.Frame(self._content, bg=p.BG_CARD)
         card.pack(fill="x", pady=(0, 16))
 
-        inner = tk.Frame(card, bg=Theme.get_color("BG_CARD"))
+        inner = tk.Frame(card, bg=p.BG_CARD)
         inner.pack(fill="x", padx=24, pady=24)
 
         # Email
@@ -175,9 +181,9 @@ class EPlanExtractorGUI:
 
         # Password
         tk.Label(
-            inner, text="Password", bg=Theme.get_color("BG_CARD"),
-            fg=Theme.get_color("TEXT_SECONDARY"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            inner, text="Password", bg=p.BG_CARD,
+            fg=p.TEXT_SECONDARY,
+            font=Theme.FONT_BODY
         ).pack(anchor="w", pady=(16, 6))
 
         self._password_entry = PasswordEntry(inner, textvariable=self._password_var)
@@ -185,12 +191,12 @@ class EPlanExtractorGUI:
 
         # Project
         tk.Label(
-            inner, text="Project Number", bg=Theme.get_color("BG_CARD"),
-            fg=Theme.get_color("TEXT_SECONDARY"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            inner, text="Project Number", bg=p.BG_CARD,
+            fg=p.TEXT_SECONDARY,
+            font=Theme.FONT_BODY
         ).pack(anchor="w", pady=(16, 6))
 
-        project_frame = tk.Frame(inner, bg=Theme.get_color("BG_CARD"))
+        project_frame = tk.Frame(inner, bg=p.BG_CARD)
         project_frame.pack(fill="x")
 
         self._project_entry = ModernEntry(
@@ -203,30 +209,31 @@ class EPlanExtractorGUI:
         if recent:
             recent_btn = tk.Label(
                 project_frame, text="Recent",
-                bg=Theme.get_color("BG_CARD"),
-                fg=Theme.get_color("TEXT_MUTED"),
-                font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL),
+                bg=p.BG_CARD,
+                fg=p.TEXT_MUTED,
+                font=Theme.FONT_SMALL,
                 cursor="hand2"
             )
             recent_btn.pack(side="right", padx=(12, 0))
             recent_btn.bind("<Button-1>", self._show_recent)
-            recent_btn.bind("<Enter>", lambda e: recent_btn.config(fg=Theme.get_color("TEXT_PRIMARY")))
-            recent_btn.bind("<Leave>", lambda e: recent_btn.config(fg=Theme.get_color("TEXT_MUTED")))
+            recent_btn.bind("<Enter>", lambda e: recent_btn.config(fg=get_palette().TEXT_PRIMARY))
+            recent_btn.bind("<Leave>", lambda e: recent_btn.config(fg=get_palette().TEXT_MUTED))
 
         # Options row
-        opts = tk.Frame(inner, bg=Theme.get_color("BG_CARD"))
+        opts = tk.Frame(inner, bg=p.BG_CARD)
         opts.pack(fill="x", pady=(20, 0))
 
         ModernCheckbox(opts, text="Excel", variable=self._export_excel_var).pack(side="left")
         ModernCheckbox(opts, text="CSV", variable=self._export_csv_var).pack(side="left", padx=(20, 0))
-        tk.Frame(opts, bg=Theme.get_color("BG_CARD"), width=40).pack(side="left")
+        tk.Frame(opts, bg=p.BG_CARD, width=40).pack(side="left")
         ModernCheckbox(opts, text="Background mode", variable=self._headless_var).pack(side="left")
 
     def _create_field(self, parent, label, var, placeholder="", validate=None) -> None:
+        p = get_palette()
         tk.Label(
-            parent, text=label, bg=Theme.get_color("BG_CARD"),
-            fg=Theme.get_color("TEXT_SECONDARY"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            parent, text=label, bg=p.BG_CARD,
+            fg=p.TEXT_SECONDARY,
+            font=Theme.FONT_BODY
         ).pack(anchor="w", pady=(0, 6))
 
         ModernEntry(
@@ -235,18 +242,19 @@ class EPlanExtractorGUI:
         ).pack(fill="x")
 
     def _create_progress(self) -> None:
-        card = tk.Frame(self._content, bg=Theme.get_color("BG_CARD"))
+        card = tk.Frame(self._content, bg=get_palette().BG_CARD)
         card.pack(fill="x", pady=(0, 16))
 
         self._progress = ProgressIndicator(card)
         self._progress.pack(fill="x", padx=20, pady=20)
 
     def _create_buttons(self) -> None:
-        frame = tk.Frame(self._content, bg=Theme.get_color("BG_PRIMARY"))
+        p = get_palette()
+        frame = tk.Frame(self._content, bg=p.BG_PRIMARY)
         frame.pack(fill="x", pady=(0, 16))
 
         # Center buttons
-        center = tk.Frame(frame, bg=Theme.get_color("BG_PRIMARY"))
+        center = tk.Frame(frame, bg=p.BG_PRIMARY)
         center.pack()
 
         self._start_btn = ModernButton(
@@ -270,13 +278,15 @@ class EPlanExtractorGUI:
         recent = self._config_manager.get_recent_projects()
         if not recent:
             return
-        menu = tk.Menu(self.root, tearoff=0, bg=Theme.get_color("BG_CARD"),
-                      fg=Theme.get_color("TEXT_PRIMARY"))
+        c = get_palette()
+        menu = tk.Menu(self.root, tearoff=0, bg=c.BG_CARD,
+                      fg=c.TEXT_PRIMARY)
         for p in recent[:8]:
             menu.add_command(label=p, command=lambda x=p: self._project_var.set(x))
         menu.post(event.x_root, event.y_root)
 
     def _show_settings(self) -> None:
+        p = get_palette()
         # Scale settings window based on main window
         w = min(500, self.root.winfo_width() - 100)
         h = min(550, self.root.winfo_height() - 100)
@@ -285,7 +295,7 @@ class EPlanExtractorGUI:
         win.title("Settings")
         win.geometry(f"{w}x{h}")
         win.minsize(350, 400)
-        win.configure(bg=Theme.get_color("BG_PRIMARY"))
+        win.configure(bg=p.BG_PRIMARY)
         win.transient(self.root)
         win.grab_set()
 
@@ -295,20 +305,20 @@ class EPlanExtractorGUI:
         win.geometry(f"+{x}+{y}")
 
         # Main frame
-        main = tk.Frame(win, bg=Theme.get_color("BG_PRIMARY"))
+        main = tk.Frame(win, bg=p.BG_PRIMARY)
         main.pack(fill="both", expand=True)
 
         # Header
         tk.Label(
-            main, text="Settings", bg=Theme.get_color("BG_PRIMARY"),
-            fg=Theme.get_color("TEXT_PRIMARY"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_TITLE, "bold")
+            main, text="Settings", bg=p.BG_PRIMARY,
+            fg=p.TEXT_PRIMARY,
+            font=Theme.FONT_TITLE_BOLD
         ).pack(anchor="w", padx=24, pady=(24, 20))
 
         # Scrollable content
-        canvas = tk.Canvas(main, bg=Theme.get_color("BG_PRIMARY"), highlightthickness=0)
+        canvas = tk.Canvas(main, bg=p.BG_PRIMARY, highlightthickness=0)
         scrollbar = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
-        content = tk.Frame(canvas, bg=Theme.get_color("BG_PRIMARY"))
+        content = tk.Frame(canvas, bg=p.BG_PRIMARY)
 
         content.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
         canvas_frame = canvas.create_window((0, 0), window=content, anchor="nw")
@@ -336,21 +346,22 @@ class EPlanExtractorGUI:
         self._section(content, "About", self._about_settings)
 
         # Footer
-        footer = tk.Frame(main, bg=Theme.get_color("BG_PRIMARY"))
+        footer = tk.Frame(main, bg=p.BG_PRIMARY)
         footer.pack(fill="x", padx=24, pady=20)
         ModernButton(footer, text="Close", command=win.destroy, primary=True, width=100).pack(side="right")
 
     def _section(self, parent, title, fn) -> None:
-        frame = tk.Frame(parent, bg=Theme.get_color("BG_CARD"))
+        p = get_palette()
+        frame = tk.Frame(parent, bg=p.BG_CARD)
         frame.pack(fill="x", pady=6, padx=(0, 16))
 
         tk.Label(
-            frame, text=title, bg=Theme.get_color("BG_CARD"),
-            fg=Theme.get_color("TEXT_PRIMARY"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_HEADING)
+            frame, text=title, bg=p.BG_CARD,
+            fg=p.TEXT_PRIMARY,
+            font=Theme.FONT_HEADING
         ).pack(anchor="w", padx=20, pady=(16, 12))
 
-        inner = tk.Frame(frame, bg=Theme.get_color("BG_CARD"))
+        inner = tk.Frame(frame, bg=p.BG_CARD)
         inner.pack(fill="x", padx=20, pady=(0, 16))
         fn(inner)
 
@@ -363,16 +374,17 @@ class EPlanExtractorGUI:
         self._config_manager.save(self._config)
 
     def _update_settings(self, parent, win) -> None:
+        p = get_palette()
         tk.Label(
             parent, text=f"Version {VERSION}",
-            bg=Theme.get_color("BG_CARD"), fg=Theme.get_color("TEXT_MUTED"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            bg=p.BG_CARD, fg=p.TEXT_MUTED,
+            font=Theme.FONT_BODY
         ).pack(anchor="w", pady=(0, 8))
 
         self._update_lbl = tk.Label(
-            parent, text="", bg=Theme.get_color("BG_CARD"),
-            fg=Theme.get_color("TEXT_MUTED"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            parent, text="", bg=p.BG_CARD,
+            fg=p.TEXT_MUTED,
+            font=Theme.FONT_BODY
         )
         self._update_lbl.pack(anchor="w", pady=(0, 12))
 
@@ -382,10 +394,11 @@ class EPlanExtractorGUI:
         ).pack(anchor="w")
 
     def _cache_settings(self, parent, win) -> None:
+        p = get_palette()
         tk.Label(
             parent, text="Clear cached extraction data",
-            bg=Theme.get_color("BG_CARD"), fg=Theme.get_color("TEXT_MUTED"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            bg=p.BG_CARD, fg=p.TEXT_MUTED,
+            font=Theme.FONT_BODY
         ).pack(anchor="w", pady=(0, 12))
 
         ModernButton(
@@ -394,11 +407,12 @@ class EPlanExtractorGUI:
         ).pack(anchor="w")
 
     def _about_settings(self, parent) -> None:
+        p = get_palette()
         tk.Label(
             parent,
             text=f"EPLAN eVIEW Extractor v{VERSION}\n\nExtracts PLC variables from EPLAN eVIEW diagrams.",
-            bg=Theme.get_color("BG_CARD"), fg=Theme.get_color("TEXT_MUTED"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY), justify="left"
+            bg=p.BG_CARD, fg=p.TEXT_MUTED,
+            font=Theme.FONT_BODY, justify="left"
         ).pack(anchor="w")
 
     def _clear_cache(self, win) -> None:
@@ -406,7 +420,7 @@ class EPlanExtractorGUI:
         messagebox.showinfo("Cache", f"Cleared {count} entries", parent=win)
 
     def _check_updates(self, win) -> None:
-        self._update_lbl.config(text="Checking...", fg=Theme.get_color("TEXT_MUTED"))
+        self._update_lbl.config(text="Checking...", fg=get_palette().TEXT_MUTED)
 
         def check():
             try:
@@ -414,18 +428,19 @@ class EPlanExtractorGUI:
                 self.root.after(0, lambda: self._update_result(release, win))
             except:
                 self.root.after(0, lambda: self._update_lbl.config(
-                    text="Check failed", fg=Theme.get_color("ACCENT_ERROR")
+                    text="Check failed", fg=get_palette().ACCENT_ERROR
                 ))
 
         threading.Thread(target=check, daemon=True).start()
 
     def _update_result(self, release, win) -> None:
+        p = get_palette()
         if release:
-            self._update_lbl.config(text=f"v{release.version} available", fg=Theme.get_color("ACCENT_SUCCESS"))
+            self._update_lbl.config(text=f"v{release.version} available", fg=p.ACCENT_SUCCESS)
             if messagebox.askyesno("Update", f"v{release.version} is available.\n\nOpen download page?", parent=win):
                 UpdateDownloader.open_release_page(release.html_url)
         else:
-            self._update_lbl.config(text="Up to date", fg=Theme.get_color("ACCENT_SUCCESS"))
+            self._update_lbl.config(text="Up to date", fg=p.ACCENT_SUCCESS)
 
     def _check_updates_silent(self) -> None:
         def check():
@@ -462,7 +477,6 @@ class EPlanExtractorGUI:
     def _log_callback(self, msg: str, level: str) -> None:
         try:
             self._log_panel.log(msg, level)
-            self.root.update_idletasks()
         except:
             pass
 
@@ -587,7 +601,8 @@ class EPlanExtractorGUI:
             self._update_step(2, 0.0)
             self.root.after(0, lambda: self._status_bar.set_status("Extracting...", "running"))
 
-            if not self._extractor.extract_variables():
+            stats = self._extractor.extract_variables()
+            if stats is None:
                 raise Exception("Extraction failed")
             self._update_step(2, 1.0)
 
@@ -597,9 +612,9 @@ class EPlanExtractorGUI:
             # Done
             self._update_step(3, 1.0)
 
-            pages = getattr(self._extractor, '_pages_processed', 0)
-            variables = getattr(self._extractor, '_variables_found', 0)
-            output = f"{self._project_var.get()} IO-List.xlsx"
+            pages = stats.pages
+            variables = stats.variables
+            output = stats.output_file
             success = True
 
             self._logger.success("Extraction complete")
@@ -610,6 +625,11 @@ class EPlanExtractorGUI:
 
             NotificationManager.notify_extraction_complete(self._project_var.get(), variables, output)
 
+        except CancelledError:
+            # Stop was pressed while a step was backing off between retries
+            error = "Cancelled"
+            self._logger.warning("Extraction cancelled")
+
         except Exception as e:
             error = str(e)
             self._logger.error(str(e))
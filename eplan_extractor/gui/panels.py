@@ -4,72 +4,161 @@ Clean panel components for the GUI.
 
 from __future__ import annotations
 
+import queue
 import tkinter as tk
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..constants import VERSION
-from .theme import Theme
+from .theme import COLORS, Theme
+
+
+# Log tag -> theme color name, resolved once when the panel is built
+LOG_TAG_COLORS = {
+    "time": "TEXT_MUTED",
+    "DEBUG": "TEXT_MUTED",
+    "INFO": "TEXT_SECONDARY",
+    "WARNING": "ACCENT_WARNING",
+    "ERROR": "ACCENT_ERROR",
+    "SUCCESS": "ACCENT_SUCCESS",
+}
+
+# Status bar state -> theme color name for the status dot
+STATUS_DOT_COLORS = {
+    "idle": "STATUS_IDLE",
+    "running": "STATUS_RUNNING",
+    "success": "STATUS_SUCCESS",
+    "error": "STATUS_ERROR",
+    "info": "ACCENT_PRIMARY",
+}
 
 
 class ProgressIndicator(tk.Canvas):
     """Simple step-based progress indicator."""
 
     STEPS = ["Login", "Project", "Extract", "Export"]
+    # One tag per step groups its circle, number and label for moving
+    STEP_TAGS = tuple(f"step{i}" for i in range(len(STEPS)))
+    Y_LINE = 20
+    Y_TEXT = 45
 
     def __init__(self, parent: tk.Widget, **kwargs) -> None:
         super().__init__(
             parent,
             height=60,
-            bg=Theme.BG_CARD,
+            bg=COLORS["BG_CARD"],
             highlightthickness=0,
             **kwargs
         )
         self._current_step = -1
         self._progress = 0.0
-        self.bind("<Configure>", lambda e: self._draw())
 
-    def _draw(self) -> None:
-        self.delete("all")
+        # Shared Theme font specs, bound locally for the draw loop
+        self._font_num = Theme.FONT_TINY
+        self._font_lbl = Theme.FONT_SMALL
+
+        # Step geometry, recomputed only when the canvas width changes
+        self._width = 0
+        self._step_width = 0.0
+        self._step_xs: Tuple[float, ...] = ()
+
+        # Persistent canvas items: created once, moved on resize, recolored on step changes
+        self._line_id: Optional[int] = None
+        self._progress_id: Optional[int] = None
+        self._circle_ids: Tuple[int, ...] = ()
+        self._label_ids: Tuple[int, ...] = ()
+
+        self.bind("<Configure>", self._on_configure)
+
+    def _on_configure(self, event: tk.Event) -> None:
+        width = event.width
+        if width != self._width:
+            old_xs = self._step_xs
+            self._width = width
+            self._step_width = (width - 60) / (len(self.STEPS) - 1)
+            self._step_xs = tuple(30 + i * self._step_width for i in range(len(self.STEPS)))
+            if self._line_id is not None:
+                self._layout(old_xs)
+            elif width >= 10:
+                self._build()
+        self._draw()
+
+    def _build(self) -> None:
+        """Create the tagged line, circle and label items for the current width."""
+        width = self._width
+        y = self.Y_LINE
+        y_text = self.Y_TEXT
+        font_num = self._font_num
+        font_lbl = self._font_lbl
+
+        # Background line
+        self._line_id = self.create_line(30, y, width - 30, y, width=2, tags="line")
+
+        # Progress line, drawn above the background line
+        self._progress_id = self.create_line(
+            30, y, 30, y, width=2, state="hidden", tags="progress"
+        )
+
+        circle_ids = []
+        label_ids = []
+        for i, (name, tag, x) in enumerate(zip(self.STEPS, self.STEP_TAGS, self._step_xs)):
+            circle_ids.append(self.create_oval(x - 8, y - 8, x + 8, y + 8, outline="", tags=tag))
+            self.create_text(x, y, text=str(i + 1), fill="#fff", font=font_num, tags=tag)
+            label_ids.append(self.create_text(x, y_text, text=name, font=font_lbl, tags=tag))
+        self._circle_ids = tuple(circle_ids)
+        self._label_ids = tuple(label_ids)
+
+    def _layout(self, old_xs: Tuple[float, ...]) -> None:
+        """Shift the existing items to the new width instead of recreating them."""
+        y = self.Y_LINE
+        self.coords(self._line_id, 30, y, self._width - 30, y)
+        for tag, old_x, x in zip(self.STEP_TAGS, old_xs, self._step_xs):
+            self.move(tag, x - old_x, 0)
 
-        width = self.winfo_width()
-        if width < 10:
+    def _draw(self) -> None:
+        """Recolor the persistent items for the current step and progress."""
+        if self._progress_id is None:
             return
 
-        steps = len(self.STEPS)
-        step_width = (width - 60) / (steps - 1)
-        y = 20
+        y = self.Y_LINE
+        current = self._current_step
+        step_width = self._step_width
 
-        # Background line
-        self.create_line(30, y, width - 30, y, fill=Theme.BORDER_COLOR, width=2)
+        # Resolve theme colors once per draw: (done, current, pending)
+        accent = COLORS["ACCENT_PRIMARY"]
+        border = COLORS["BORDER_COLOR"]
+        text_primary = COLORS["TEXT_PRIMARY"]
+        circle_colors = (COLORS["ACCENT_SUCCESS"], accent, border)
+        label_colors = (text_primary, text_primary, COLORS["TEXT_MUTED"])
+
+        itemconfig = self.itemconfig
+        itemconfig(self._line_id, fill=border)
 
         # Progress line
-        if self._current_step >= 0:
-            progress_x = 30 + (self._current_step * step_width) + (self._progress * step_width)
-            progress_x = min(progress_x, width - 30)
-            self.create_line(30, y, progress_x, y, fill=Theme.ACCENT_PRIMARY, width=2)
+        if current >= 0:
+            progress_x = 30 + (current * step_width) + (self._progress * step_width)
+            progress_x = min(progress_x, self._width - 30)
+            self.coords(self._progress_id, 30, y, progress_x, y)
+            itemconfig(self._progress_id, fill=accent, state="normal")
+        else:
+            itemconfig(self._progress_id, state="hidden")
 
         # Step circles
-        for i, name in enumerate(self.STEPS):
-            x = 30 + i * step_width
-
-            if i < self._current_step:
-                color = Theme.ACCENT_SUCCESS
-                fg = Theme.TEXT_PRIMARY
-            elif i == self._current_step:
-                color = Theme.ACCENT_PRIMARY
-                fg = Theme.TEXT_PRIMARY
-            else:
-                color = Theme.BORDER_COLOR
-                fg = Theme.TEXT_MUTED
-
-            self.create_oval(x - 8, y - 8, x + 8, y + 8, fill=color, outline="")
-            self.create_text(x, y, text=str(i + 1), fill="#fff", font=(Theme.FONT_FAMILY, 8))
-            self.create_text(x, y + 25, text=name, fill=fg, font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL))
+        for i, (circle_id, label_id) in enumerate(zip(self._circle_ids, self._label_ids)):
+            state = 0 if i < current else (1 if i == current else 2)
+            itemconfig(circle_id, fill=circle_colors[state])
+            itemconfig(label_id, fill=label_colors[state])
 
     def set_step(self, step: int, progress: float = 0.0) -> None:
+        p = progress
+        if p < 0.0:
+            p = 0.0
+        elif p > 1.0:
+            p = 1.0
+        if step == self._current_step and p == self._progress:
+            return
         self._current_step = step
-        self._progress = max(0.0, min(1.0, progress))
+        self._progress = p
         self._draw()
 
     def reset(self) -> None:
@@ -82,23 +171,25 @@ class StatusBar(tk.Frame):
     """Simple status bar."""
 
     def __init__(self, parent: tk.Widget, **kwargs) -> None:
-        super().__init__(parent, bg=Theme.BG_SECONDARY, **kwargs)
+        bg = COLORS["BG_SECONDARY"]
+        font_small = Theme.FONT_SMALL
+        super().__init__(parent, bg=bg, **kwargs)
 
         self._dot = tk.Label(
             self,
             text="",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.STATUS_IDLE,
-            font=(Theme.FONT_FAMILY, 8)
+            bg=bg,
+            fg=COLORS["STATUS_IDLE"],
+            font=Theme.FONT_TINY
         )
         self._dot.pack(side="left", padx=(15, 8), pady=8)
 
         self._text = tk.Label(
             self,
             text="Ready",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_SECONDARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL),
+            bg=bg,
+            fg=COLORS["TEXT_SECONDARY"],
+            font=font_small,
             anchor="w"
         )
         self._text.pack(side="left", fill="x", expand=True, pady=8)
@@ -106,61 +197,58 @@ class StatusBar(tk.Frame):
         self._version = tk.Label(
             self,
             text=f"v{VERSION}",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_MUTED,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL)
+            bg=bg,
+            fg=COLORS["TEXT_MUTED"],
+            font=font_small
         )
         self._version.pack(side="right", padx=15, pady=8)
 
     def set_status(self, message: str, status: str = "idle") -> None:
         self._text.config(text=message)
-        colors = {
-            "idle": Theme.STATUS_IDLE,
-            "running": Theme.STATUS_RUNNING,
-            "success": Theme.STATUS_SUCCESS,
-            "error": Theme.STATUS_ERROR,
-            "info": Theme.ACCENT_PRIMARY
-        }
-        self._dot.config(fg=colors.get(status, Theme.STATUS_IDLE))
+        self._dot.config(fg=COLORS[STATUS_DOT_COLORS.get(status, "STATUS_IDLE")])
 
 
 class LogPanel(tk.Frame):
     """Clean log panel."""
 
     def __init__(self, parent: tk.Widget, **kwargs) -> None:
-        super().__init__(parent, bg=Theme.BG_SECONDARY, **kwargs)
+        bg = COLORS["BG_SECONDARY"]
+        text_primary = COLORS["TEXT_PRIMARY"]
+        text_muted = COLORS["TEXT_MUTED"]
+        font_small = Theme.FONT_SMALL
+        super().__init__(parent, bg=bg, **kwargs)
 
         # Header
-        header = tk.Frame(self, bg=Theme.BG_SECONDARY)
+        header = tk.Frame(self, bg=bg)
         header.pack(fill="x", padx=12, pady=(12, 8))
 
         tk.Label(
             header,
             text="Log",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_PRIMARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_HEADING)
+            bg=bg,
+            fg=text_primary,
+            font=Theme.FONT_HEADING
         ).pack(side="left")
 
         clear_btn = tk.Label(
             header,
             text="Clear",
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_MUTED,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL),
+            bg=bg,
+            fg=text_muted,
+            font=font_small,
             cursor="hand2"
         )
         clear_btn.pack(side="right")
         clear_btn.bind("<Button-1>", lambda e: self.clear())
-        clear_btn.bind("<Enter>", lambda e: clear_btn.config(fg=Theme.TEXT_PRIMARY))
-        clear_btn.bind("<Leave>", lambda e: clear_btn.config(fg=Theme.TEXT_MUTED))
+        clear_btn.bind("<Enter>", lambda e: clear_btn.config(fg=COLORS["TEXT_PRIMARY"]))
+        clear_btn.bind("<Leave>", lambda e: clear_btn.config(fg=COLORS["TEXT_MUTED"]))
 
         # Log area
         self._text = tk.Text(
             self,
-            bg=Theme.BG_PRIMARY,
-            fg=Theme.TEXT_SECONDARY,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL),
+            bg=COLORS["BG_PRIMARY"],
+            fg=COLORS["TEXT_SECONDARY"],
+            font=font_small,
             relief="flat",
             padx=12,
             pady=8,
@@ -168,28 +256,49 @@ class LogPanel(tk.Frame):
             state="disabled",
             height=8
         )
-        self._text.pack(fill="both", expand=True, padx=12, pady=(0, 12))
 
         # Tags
-        self._text.tag_configure("time", foreground=Theme.TEXT_MUTED)
-        self._text.tag_configure("DEBUG", foreground=Theme.TEXT_MUTED)
-        self._text.tag_configure("INFO", foreground=Theme.TEXT_SECONDARY)
-        self._text.tag_configure("WARNING", foreground=Theme.ACCENT_WARNING)
-        self._text.tag_configure("ERROR", foreground=Theme.ACCENT_ERROR)
-        self._text.tag_configure("SUCCESS", foreground=Theme.ACCENT_SUCCESS)
+        for tag, color_name in LOG_TAG_COLORS.items():
+            self._text.tag_configure(tag, foreground=COLORS[color_name])
 
         # Scrollbar
         scrollbar = tk.Scrollbar(self._text, command=self._text.yview)
         scrollbar.pack(side="right", fill="y")
         self._text.config(yscrollcommand=scrollbar.set)
 
+        # Pack last so geometry is computed once the widget is fully set up
+        self._text.pack(fill="both", expand=True, padx=12, pady=(0, 12))
+
+        # Pending (time, message, level) entries, drained on the next idle tick
+        self._queue: "queue.Queue[Tuple[str, str, str]]" = queue.Queue()
+        self._flush_pending = False
+
     def log(self, message: str, level: str = "INFO") -> None:
-        self._text.config(state="normal")
         time = datetime.now().strftime("%H:%M:%S")
-        self._text.insert("end", f"[{time}] ", "time")
-        self._text.insert("end", f"{message}\n", level)
-        self._text.see("end")
-        self._text.config(state="disabled")
+        self._queue.put((time, message, level))
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.after_idle(self._flush)
+
+    def _flush(self) -> None:
+        """Insert all queued log entries in a single normal/disabled cycle."""
+        self._flush_pending = False
+        text = self._text
+        text.config(state="normal")
+        try:
+            while True:
+                time, message, level = self._queue.get_nowait()
+                text.insert("end", f"[{time}] ", "time", f"{message}\n", level)
+        except queue.Empty:
+            pass
+        text.see("end")
+        text.config(state="disabled")
+
+        # Commit the display list without re-entering the event dispatcher.
+        # Never call update() here: it processes events recursively and can
+        # repaint several times per burst ("update considered harmful").
+        if self._queue.empty():
+            text.update_idletasks()
 
     def clear(self) -> None:
         self._text.config(state="normal")
@@ -2,7 +2,13 @@
 Professional color theme with light/dark mode support.
 """
 
-from typing import Dict
+import sys
+import weakref
+from dataclasses import make_dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Observers take no arguments and re-read colors from Theme themselves
+ThemeObserver = Callable[[], None]
 
 
 # Professional Dark theme - clean, minimal, corporate
@@ -102,12 +108,54 @@ LIGHT_THEME = {
 }
 
 
-class Theme:
+# Palette keys. Literal keys are interned by the compiler already; interning
+# explicitly keeps that guarantee for names built at runtime (see
+# ThemeApplier.register), so lookups can short-circuit on identity.
+# Values are interned too, so every widget configured with a color passes
+# the same string object to Tk and its color cache hits on identity.
+COLOR_NAMES = tuple(sys.intern(name) for name in DARK_THEME)
+DARK_THEME = {name: sys.intern(DARK_THEME[name]) for name in COLOR_NAMES}
+LIGHT_THEME = {name: sys.intern(LIGHT_THEME[name]) for name in COLOR_NAMES}
+
+# Immutable attribute view of one palette, one slot per palette key:
+# ``Theme.snapshot().BG_CARD``
+ColorPalette = make_dataclass(
+    "ColorPalette",
+    [(name, str) for name in COLOR_NAMES],
+    frozen=True,
+    slots=True,
+)
+ColorPalette.__module__ = __name__
+
+DARK_SNAPSHOT = ColorPalette(**DARK_THEME)
+LIGHT_SNAPSHOT = ColorPalette(**LIGHT_THEME)
+
+# Active palette. Theme switches update this dict in place, so modules can
+# import it once and index it directly: ``COLORS["BG_PRIMARY"]``.
+COLORS: Dict[str, str] = DARK_THEME.copy()
+
+
+class _ThemeMeta(type):
+    """Resolves ``Theme.BG_PRIMARY``-style reads against the active palette."""
+
+    def __getattr__(cls, name: str) -> str:
+        # Only reached when regular class attribute lookup fails
+        try:
+            return COLORS[name]
+        except KeyError:
+            raise AttributeError(f"type object 'Theme' has no attribute {name!r}") from None
+
+
+class Theme(metaclass=_ThemeMeta):
     """Professional theme manager."""
 
     _is_dark_mode: bool = True
-    _colors: Dict[str, str] = DARK_THEME.copy()
-    _observers: list = []
+    _colors: Dict[str, str] = COLORS
+    current: "ColorPalette" = DARK_SNAPSHOT
+    # Insertion-ordered set of weak refs: O(1) membership, stable notify order
+    _observers: Dict["weakref.ReferenceType[ThemeObserver]", None] = {}
+    _root: Optional[Any] = None
+    _notify_pending: bool = False
 
     # Clean typography
     FONT_FAMILY = "Segoe UI"
@@ -116,131 +164,171 @@ class Theme:
     FONT_SIZE_BODY = 10
     FONT_SIZE_SMALL = 9
 
+    # Shared font specs; pass these instead of building a tuple per widget
+    FONT_TITLE = (FONT_FAMILY, FONT_SIZE_TITLE)
+    FONT_TITLE_BOLD = (FONT_FAMILY, FONT_SIZE_TITLE, "bold")
+    FONT_HEADING = (FONT_FAMILY, FONT_SIZE_HEADING)
+    FONT_HEADING_BOLD = (FONT_FAMILY, FONT_SIZE_HEADING, "bold")
+    FONT_BODY = (FONT_FAMILY, FONT_SIZE_BODY)
+    FONT_BODY_BOLD = (FONT_FAMILY, FONT_SIZE_BODY, "bold")
+    FONT_SMALL = (FONT_FAMILY, FONT_SIZE_SMALL)
+    FONT_TINY = (FONT_FAMILY, 8)
+
     @classmethod
     def is_dark_mode(cls) -> bool:
         return cls._is_dark_mode
 
+    @classmethod
+    def bind_root(cls, root: Any) -> None:
+        """Dispatch observer notifications through the Tk event loop of ``root``."""
+        cls._root = root
+
     @classmethod
     def set_dark_mode(cls, enabled: bool) -> None:
+        if cls._is_dark_mode == enabled:
+            return  # Nothing to repaint
         cls._is_dark_mode = enabled
-        cls._colors = DARK_THEME.copy() if enabled else LIGHT_THEME.copy()
-        for callback in cls._observers:
+        cls._colors.clear()
+        cls._colors.update(DARK_THEME if enabled else LIGHT_THEME)
+        cls.current = DARK_SNAPSHOT if enabled else LIGHT_SNAPSHOT
+        cls._schedule_notify()
+
+    @classmethod
+    def _schedule_notify(cls) -> None:
+        """Queue a single observer drain on the next idle tick."""
+        if cls._root is None:
+            cls._notify_observers()
+            return
+
+        if cls._notify_pending:
+            return
+
+        try:
+            cls._root.after_idle(cls._notify_observers)
+            cls._notify_pending = True
+        except Exception:
+            pass  # Root already destroyed, nothing left to repaint
+
+    @classmethod
+    def _notify_observers(cls) -> None:
+        cls._notify_pending = False
+        dead = []
+        for ref in list(cls._observers):
+            callback = ref()
+            if callback is None:
+                dead.append(ref)
+                continue
             try:
                 callback()
             except Exception:
                 pass
+        for ref in dead:
+            cls._observers.pop(ref, None)
 
     @classmethod
     def toggle_mode(cls) -> bool:
         cls.set_dark_mode(not cls._is_dark_mode)
         return cls._is_dark_mode
 
-    @classmethod
-    def add_observer(cls, callback) -> None:
-        if callback not in cls._observers:
-            cls._observers.append(callback)
+    @staticmethod
+    def _weak(callback: ThemeObserver) -> "weakref.ReferenceType[ThemeObserver]":
+        """Bound methods need WeakMethod, otherwise the ref dies immediately."""
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return weakref.WeakMethod(callback)
+        return weakref.ref(callback)
 
     @classmethod
-    def remove_observer(cls, callback) -> None:
-        if callback in cls._observers:
-            cls._observers.remove(callback)
+    def add_observer(cls, callback: ThemeObserver) -> None:
+        """
+        Register a theme change callback.
 
-    @classmethod
-    def get_color(cls, name: str) -> str:
-        return cls._colors.get(name, "#000000")
+        Callbacks are held weakly, so destroyed widgets drop out on their
+        own. Keep a reference to plain functions for as long as they should
+        stay registered.
+        """
+        cls._observers.setdefault(cls._weak(callback))
 
-    # Properties for direct access
     @classmethod
-    @property
-    def BG_PRIMARY(cls) -> str:
-        return cls._colors["BG_PRIMARY"]
+    def remove_observer(cls, callback: ThemeObserver) -> None:
+        cls._observers.pop(cls._weak(callback), None)
 
     @classmethod
-    @property
-    def BG_SECONDARY(cls) -> str:
-        return cls._colors["BG_SECONDARY"]
+    def snapshot(cls) -> "ColorPalette":
+        """Return the active palette; a new snapshot is published on every switch."""
+        return cls.current
 
     @classmethod
-    @property
-    def BG_CARD(cls) -> str:
-        return cls._colors["BG_CARD"]
+    def get_color(cls, name: str) -> str:
+        return cls._colors.get(name, "#000000")
 
-    @classmethod
-    @property
-    def BG_INPUT(cls) -> str:
-        return cls._colors["BG_INPUT"]
 
-    @classmethod
-    @property
-    def ACCENT_PRIMARY(cls) -> str:
-        return cls._colors["ACCENT_PRIMARY"]
+def get_palette() -> "ColorPalette":
+    """
+    Return the active palette.
 
-    @classmethod
-    @property
-    def ACCENT_SUCCESS(cls) -> str:
-        return cls._colors["ACCENT_SUCCESS"]
+    Hot paths should hold the result and read attributes from it
+    (``p.BG_CARD``) instead of calling ``Theme.get_color`` per color.
+    """
+    return Theme.current
 
-    @classmethod
-    @property
-    def ACCENT_WARNING(cls) -> str:
-        return cls._colors["ACCENT_WARNING"]
 
-    @classmethod
-    @property
-    def ACCENT_ERROR(cls) -> str:
-        return cls._colors["ACCENT_ERROR"]
+class ThemeApplier:
+    """
+    Re-applies static widget colors when the theme changes.
 
-    @classmethod
-    @property
-    def TEXT_PRIMARY(cls) -> str:
-        return cls._colors["TEXT_PRIMARY"]
+    Widgets register the options they set from the palette once at build
+    time; on a theme switch every registration is reconfigured in a single
+    pass, so widgets need no per-instance observer for fixed colors.
+    """
 
-    @classmethod
-    @property
-    def TEXT_SECONDARY(cls) -> str:
-        return cls._colors["TEXT_SECONDARY"]
-
-    @classmethod
-    @property
-    def TEXT_MUTED(cls) -> str:
-        return cls._colors["TEXT_MUTED"]
+    # (widget ref, canvas item id or None, option, color name)
+    _registrations: List[Tuple["weakref.ReferenceType[Any]", Optional[int], str, str]] = []
 
     @classmethod
-    @property
-    def BORDER_COLOR(cls) -> str:
-        return cls._colors["BORDER_COLOR"]
+    def register(
+        cls,
+        widget: Any,
+        item_id: Optional[int],
+        option: str,
+        color_name: str
+    ) -> None:
+        """
+        Keep ``option`` of ``widget`` in sync with palette color ``color_name``.
+
+        Args:
+            widget: Tk widget to reconfigure
+            item_id: Canvas item id, or None to configure the widget itself
+            option: Option name, e.g. "bg" or "fill"
+            color_name: Palette key, e.g. "BG_CARD"
+        """
+        cls._registrations.append(
+            (weakref.ref(widget), item_id, option, sys.intern(color_name))
+        )
 
     @classmethod
-    @property
-    def BORDER_FOCUS(cls) -> str:
-        return cls._colors["BORDER_FOCUS"]
+    def register_options(cls, widget: Any, **options: str) -> None:
+        """Register several widget options at once: ``bg="BG_CARD", fg="TEXT_PRIMARY"``."""
+        for option, color_name in options.items():
+            cls.register(widget, None, option, color_name)
 
     @classmethod
-    @property
-    def BORDER_ERROR(cls) -> str:
-        return cls._colors["BORDER_ERROR"]
-
-    @classmethod
-    @property
-    def BORDER_SUCCESS(cls) -> str:
-        return cls._colors["BORDER_SUCCESS"]
-
-    @classmethod
-    @property
-    def STATUS_IDLE(cls) -> str:
-        return cls._colors["STATUS_IDLE"]
-
-    @classmethod
-    @property
-    def STATUS_RUNNING(cls) -> str:
-        return cls._colors["STATUS_RUNNING"]
+    def apply(cls) -> None:
+        colors = COLORS
+        alive = []
+        for registration in cls._registrations:
+            ref, item_id, option, color_name = registration
+            widget = ref()
+            if widget is None:
+                continue
+            try:
+                if item_id is None:
+                    widget.config(**{option: colors[color_name]})
+                else:
+                    widget.itemconfig(item_id, **{option: colors[color_name]})
+            except Exception:
+                continue  # Widget destroyed on the Tk side
+            alive.append(registration)
+        cls._registrations = alive
 
-    @classmethod
-    @property
-    def STATUS_SUCCESS(cls) -> str:
-        return cls._colors["STATUS_SUCCESS"]
 
-    @classmethod
-    @property
-    def STATUS_ERROR(cls) -> str:
-        return cls._colors["STATUS_ERROR"]
+Theme.add_observer(ThemeApplier.apply)
@@ -4,11 +4,18 @@ System tray integration for background operation.
 
 import threading
 import tkinter as tk
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from .theme import Theme
 from ..utils.i18n import t
 
+# Optional tray dependencies, resolved once at import
+try:
+    import pystray as _pystray
+    from PIL import Image as _Image, ImageDraw as _ImageDraw
+except ImportError:
+    _pystray = _Image = _ImageDraw = None
+
 
 class SystemTray:
     """
@@ -18,6 +25,9 @@ class SystemTray:
     Falls back gracefully if pystray is not available.
     """
 
+    # (is_dark, size) -> rendered icon image
+    _icon_cache: Dict[Tuple[bool, int], Any] = {}
+
     def __init__(
         self,
         root: tk.Tk,
@@ -50,12 +60,7 @@ class SystemTray:
 
     def _check_availability(self) -> None:
         """Check if system tray is available."""
-        try:
-            import pystray
-            from PIL import Image
-            self._available = True
-        except ImportError:
-            self._available = False
+        self._available = _pystray is not None
 
     def is_available(self) -> bool:
         """Check if system tray functionality is available."""
@@ -74,91 +79,95 @@ class SystemTray:
         self._is_running = is_running
         self._update_menu()
 
+    @classmethod
+    def _clear_icon_cache(cls) -> None:
+        cls._icon_cache.clear()
+
     def _create_icon_image(self, size: int = 64):
-        """Create a simple icon image."""
-        try:
-            from PIL import Image, ImageDraw
-
-            # Create a simple "E" icon
-            image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(image)
-
-            # Background circle
-            bg_color = (41, 128, 185) if Theme.is_dark_mode() else (52, 152, 219)
-            draw.ellipse([2, 2, size - 2, size - 2], fill=bg_color)
-
-            # Letter "E"
-            text_color = (255, 255, 255)
-            font_size = size // 2
-
-            # Draw simple E shape
-            margin = size // 5
-            thickness = size // 8
-
-            # Vertical bar
-            draw.rectangle([margin, margin, margin + thickness, size - margin], fill=text_color)
-            # Top bar
-            draw.rectangle([margin, margin, size - margin, margin + thickness], fill=text_color)
-            # Middle bar
-            mid = size // 2
-            draw.rectangle([margin, mid - thickness // 2, size - margin - thickness, mid + thickness // 2], fill=text_color)
-            # Bottom bar
-            draw.rectangle([margin, size - margin - thickness, size - margin, size - margin], fill=text_color)
+        """Create a simple icon image, reusing the one built for this theme and size."""
+        if _Image is None:
+            return None
 
+        key = (Theme.is_dark_mode(), size)
+        image = self._icon_cache.get(key)
+        if image is not None:
             return image
 
-        except ImportError:
-            return None
+        # Create a simple "E" icon
+        image = _Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        draw = _ImageDraw.Draw(image)
+        rectangle = draw.rectangle
+
+        # Background circle
+        bg_color = (41, 128, 185) if key[0] else (52, 152, 219)
+        draw.ellipse([2, 2, size - 2, size - 2], fill=bg_color)
+
+        # Letter "E"
+        text_color = (255, 255, 255)
+
+        # Draw simple E shape
+        margin = size // 5
+        thickness = size // 8
+
+        # Vertical bar
+        rectangle([margin, margin, margin + thickness, size - margin], fill=text_color)
+        # Top bar
+        rectangle([margin, margin, size - margin, margin + thickness], fill=text_color)
+        # Middle bar
+        mid = size // 2
+        rectangle([margin, mid - thickness // 2, size - margin - thickness, mid + thickness // 2], fill=text_color)
+        # Bottom bar
+        rectangle([margin, size - margin - thickness, size - margin, size - margin], fill=text_color)
+
+        self._icon_cache[key] = image
+        return image
 
     def _create_menu(self):
         """Create the tray menu."""
-        try:
-            import pystray
-
-            def show_window(icon, item):
-                if self._on_show:
-                    self._root.after(0, self._on_show)
-
-            def start_extraction(icon, item):
-                if self._on_start and not self._is_running:
-                    self._root.after(0, self._on_start)
-
-            def stop_extraction(icon, item):
-                if self._on_stop and self._is_running:
-                    self._root.after(0, self._on_stop)
-
-            def quit_app(icon, item):
-                if self._on_quit:
-                    self._root.after(0, self._on_quit)
-
-            menu = pystray.Menu(
-                pystray.MenuItem(
-                    t("app_title"),
-                    show_window,
-                    default=True
-                ),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem(
-                    t("start_extraction"),
-                    start_extraction,
-                    enabled=lambda item: not self._is_running
-                ),
-                pystray.MenuItem(
-                    t("stop"),
-                    stop_extraction,
-                    enabled=lambda item: self._is_running
-                ),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem(
-                    t("close"),
-                    quit_app
-                )
-            )
+        if _pystray is None:
+            return None
 
-            return menu
+        def show_window(icon, item):
+            if self._on_show:
+                self._root.after(0, self._on_show)
 
-        except ImportError:
-            return None
+        def start_extraction(icon, item):
+            if self._on_start and not self._is_running:
+                self._root.after(0, self._on_start)
+
+        def stop_extraction(icon, item):
+            if self._on_stop and self._is_running:
+                self._root.after(0, self._on_stop)
+
+        def quit_app(icon, item):
+            if self._on_quit:
+                self._root.after(0, self._on_quit)
+
+        menu = _pystray.Menu(
+            _pystray.MenuItem(
+                t("app_title"),
+                show_window,
+                default=True
+            ),
+            _pystray.Menu.SEPARATOR,
+            _pystray.MenuItem(
+                t("start_extraction"),
+                start_extraction,
+                enabled=lambda item: not self._is_running
+            ),
+            _pystray.MenuItem(
+                t("stop"),
+                stop_extraction,
+                enabled=lambda item: self._is_running
+            ),
+            _pystray.Menu.SEPARATOR,
+            _pystray.MenuItem(
+                t("close"),
+                quit_app
+            )
+        )
+
+        return menu
 
     def _update_menu(self) -> None:
         """Update the menu (refresh enabled states)."""
@@ -179,23 +188,22 @@ class SystemTray:
             return False
 
         try:
-            import pystray
-
-            image = self._create_icon_image()
-            if image is None:
-                return False
-
             menu = self._create_menu()
 
-            self._icon = pystray.Icon(
+            # The image is drawn on the tray thread, see _setup_icon
+            self._icon = _pystray.Icon(
                 "eplan_extractor",
-                image,
+                None,
                 t("app_title"),
                 menu
             )
 
             # Run in separate thread
-            thread = threading.Thread(target=self._icon.run, daemon=True)
+            thread = threading.Thread(
+                target=self._icon.run,
+                kwargs={"setup": self._setup_icon},
+                daemon=True
+            )
             thread.start()
 
             return True
@@ -203,6 +211,14 @@ class SystemTray:
         except Exception:
             return False
 
+    def _setup_icon(self, icon) -> None:
+        """pystray setup hook: build the image off the Tk thread, then show it."""
+        image = self._create_icon_image()
+        if image is None:
+            return
+        icon.icon = image
+        icon.visible = True
+
     def stop(self) -> None:
         """Stop the system tray icon."""
         if self._icon:
@@ -252,6 +268,10 @@ class SystemTray:
                 pass
 
 
+# Icons of the previous theme are never shown again
+Theme.add_observer(SystemTray._clear_icon_cache)
+
+
 class TrayMinimizeBehavior:
     """
     Mixin behavior for handling minimize-to-tray.
@@ -4,132 +4,337 @@ Clean, professional widgets for the GUI.
 
 from __future__ import annotations
 
+import math
 import tkinter as tk
-from typing import Callable, Optional
+import tkinter.font as tkfont
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
-from .theme import Theme
+from .theme import COLORS, Theme, ThemeApplier, get_palette
 
+# Module aliases for the shared Theme font specs
+FONT_TITLE = Theme.FONT_TITLE
+FONT_HEADING = Theme.FONT_HEADING
+FONT_BODY = Theme.FONT_BODY
+FONT_SMALL = Theme.FONT_SMALL
 
-class Tooltip:
-    """Simple tooltip for widgets."""
+# Tk font objects for the tuples above, created on first use (needs a root)
+_named_fonts: dict[tuple[str, int], tkfont.Font] = {}
+
+
+def _named_font(spec: tuple[str, int]) -> tkfont.Font:
+    """Return the shared Tk font for a (family, size) tuple."""
+    font = _named_fonts.get(spec)
+    if font is None:
+        font = _named_fonts[spec] = tkfont.Font(family=spec[0], size=spec[1])
+    return font
 
-    def __init__(self, widget: tk.Widget, text: str, delay: int = 500) -> None:
-        self.widget = widget
-        self.text = text
-        self.delay = delay
-        self._window: Optional[tk.Toplevel] = None
-        self._id: Optional[str] = None
-
-        widget.bind("<Enter>", self._schedule)
-        widget.bind("<Leave>", self._hide)
-        widget.bind("<ButtonPress>", self._hide)
-
-    def _schedule(self, event: tk.Event) -> None:
-        self._id = self.widget.after(self.delay, self._show)
-
-    def _hide(self, event: tk.Event = None) -> None:
-        if self._id:
-            self.widget.after_cancel(self._id)
-            self._id = None
-        if self._window:
-            self._window.destroy()
-            self._window = None
-
-    def _show(self) -> None:
-        if self._window:
-            return
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
 
-        self._window = tk.Toplevel(self.widget)
-        self._window.wm_overrideredirect(True)
-        self._window.wm_geometry(f"+{x}+{y}")
+# Runs ModernEntry validators off the Tk thread, one at a time
+_validation_executor: ThreadPoolExecutor | None = None
 
-        tk.Label(
-            self._window,
-            text=self.text,
+
+def _validation_pool() -> ThreadPoolExecutor:
+    global _validation_executor
+    if _validation_executor is None:
+        _validation_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="entry-validation"
+        )
+    return _validation_executor
+
+
+class TooltipManager:
+    """
+    Shared tooltip dispatcher.
+
+    Tooltipped widgets get an extra "tooltip" bindtag instead of their own
+    Enter/Leave/ButtonPress bindings. The handlers are bound once on that
+    tag and look the text up by widget path. A single root-owned tooltip
+    window is created on first use and then only withdrawn and re-shown;
+    it is rebuilt if the root it belonged to has been destroyed.
+
+    Tooltip positions are cached per widget and dropped whenever a toplevel
+    holding tooltipped widgets sees a <Configure> (resize, move, relayout).
+    """
+
+    TAG = "tooltip"
+
+    # Widget path -> (text, delay in ms)
+    _tips: dict[str, tuple[str, int]] = {}
+    _bound: bool = False
+    _window: tk.Toplevel | None = None
+    _label: tk.Label | None = None
+    _visible: bool = False
+    _current: str | None = None
+    _after_id: str | None = None
+    _after_widget: tk.Widget | None = None
+    # Widget path -> screen position of the tooltip, valid until <Configure>
+    _positions: dict[str, tuple[int, int]] = {}
+    # Toplevel paths whose <Configure> already invalidates _positions
+    _watched: set[str] = set()
+
+    @classmethod
+    def register(cls, widget: tk.Widget, text: str, delay: int = 500) -> None:
+        """
+        Show ``text`` when the pointer rests on ``widget``.
+
+        Args:
+            widget: Widget to attach the tooltip to
+            text: Tooltip text
+            delay: Hover time in milliseconds before the tooltip appears
+        """
+        if not cls._bound:
+            widget.bind_class(cls.TAG, "<Enter>", cls._schedule)
+            widget.bind_class(cls.TAG, "<Leave>", cls._hide)
+            widget.bind_class(cls.TAG, "<ButtonPress>", cls._hide)
+            widget.bind_class(cls.TAG, "<Destroy>", cls._forget)
+            cls._bound = True
+
+        tags = widget.bindtags()
+        if cls.TAG not in tags:
+            widget.bindtags(tags + (cls.TAG,))
+        cls._tips[str(widget)] = (text, delay)
+
+        # Children deliver <Configure> to their toplevel's bindtag as well,
+        # so one binding per toplevel catches moves and relayouts alike
+        toplevel = widget.winfo_toplevel()
+        if str(toplevel) not in cls._watched:
+            toplevel.bind("<Configure>", cls._invalidate_positions, add="+")
+            cls._watched.add(str(toplevel))
+
+    @classmethod
+    def update_text(cls, widget: tk.Widget, text: str) -> None:
+        key = str(widget)
+        entry = cls._tips.get(key)
+        if entry is not None:
+            cls._tips[key] = (text, entry[1])
+
+    @classmethod
+    def _schedule(cls, event: tk.Event) -> None:
+        widget = event.widget
+        entry = cls._tips.get(str(widget))
+        if entry is None:
+            return
+        cls._hide()
+        cls._current = str(widget)
+        cls._after_widget = widget
+        cls._after_id = widget.after(entry[1], lambda: cls._show(widget))
+
+    @classmethod
+    def _cancel(cls) -> None:
+        if cls._after_id is not None:
+            try:
+                cls._after_widget.after_cancel(cls._after_id)
+            except Exception:
+                pass
+        cls._after_id = None
+        cls._after_widget = None
+
+    @classmethod
+    def _hide(cls, event: tk.Event = None) -> None:
+        cls._cancel()
+        if cls._visible:
+            try:
+                cls._window.withdraw()
+            except Exception:
+                pass
+            cls._visible = False
+        cls._current = None
+
+    @classmethod
+    def _invalidate_positions(cls, event: tk.Event) -> None:
+        cls._positions.clear()
+
+    @classmethod
+    def _forget(cls, event: tk.Event) -> None:
+        key = str(event.widget)
+        if key == cls._current:
+            cls._hide()
+        cls._tips.pop(key, None)
+        cls._positions.pop(key, None)
+
+    @classmethod
+    def _create_window(cls, root: tk.Misc) -> None:
+        """Build the shared tooltip window once, owned by the application root."""
+        window = tk.Toplevel(root)
+        window.withdraw()
+        window.wm_overrideredirect(True)
+        cls._label = tk.Label(
+            window,
             bg="#333",
             fg="#fff",
             relief="flat",
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL),
+            font=_named_font(FONT_SMALL),
             padx=8,
             pady=4
-        ).pack()
+        )
+        cls._label.pack()
+        window.bind("<Destroy>", cls._on_window_destroy)
+        cls._window = window
+
+    @classmethod
+    def _on_window_destroy(cls, event: tk.Event) -> None:
+        # Fires for the label too; only a destroyed window needs rebuilding
+        if event.widget is cls._window:
+            cls._window = None
+            cls._label = None
+            cls._visible = False
+
+    @classmethod
+    def _show(cls, widget: tk.Widget) -> None:
+        cls._after_id = None
+        cls._after_widget = None
+        key = str(widget)
+        entry = cls._tips.get(key)
+        if entry is None:
+            return
+        position = cls._positions.get(key)
+        if position is None:
+            position = cls._positions[key] = (
+                widget.winfo_rootx() + 20,
+                widget.winfo_rooty() + widget.winfo_height() + 5,
+            )
+        x, y = position
+
+        if cls._window is None:
+            cls._create_window(widget.nametowidget("."))
+
+        cls._label.config(text=entry[0])
+        cls._window.wm_geometry(f"+{x}+{y}")
+        cls._window.deiconify()
+        cls._visible = True
+
+
+class Tooltip:
+    """Simple tooltip for widgets."""
+
+    def __init__(self, widget: tk.Widget, text: str, delay: int = 500) -> None:
+        self.widget = widget
+        self.text = text
+        self.delay = delay
+        TooltipManager.register(widget, text, delay)
 
     def update_text(self, text: str) -> None:
         self.text = text
+        TooltipManager.update_text(self.widget, text)
 
 
 class ModernEntry(tk.Frame):
     """Clean entry field with border styling."""
 
+    # How often the Tk thread checks for a finished validator
+    VALIDATION_POLL_MS = 20
+
     def __init__(
         self,
         parent: tk.Widget,
         placeholder: str = "",
         show: str = "",
-        textvariable: Optional[tk.StringVar] = None,
+        textvariable: tk.StringVar | None = None,
         tooltip: str = "",
-        validate_func: Optional[Callable[[str], bool]] = None,
+        validate_func: Callable[[str], bool] | None = None,
         **kwargs
     ) -> None:
-        super().__init__(parent, bg=Theme.get_color("BG_CARD"))
+        c = get_palette()
+        super().__init__(parent, bg=c.BG_CARD)
 
         self._placeholder = placeholder
+        self._showing_placeholder = False
+        # True while the placeholder itself is written into the entry
+        self._writing_placeholder = False
         self._show_char = show
         self._has_focus = False
         self._validate_func = validate_func
-        self._is_valid: Optional[bool] = None
+        self._is_valid: bool | None = None
         self._textvariable = textvariable
+        self._validate_after_id: str | None = None
+        self._pending_value = ""
+        self._validation_seq = 0
+        self._last_border_color = c.BORDER_COLOR
+        self._entry_style = (c.TEXT_PRIMARY, show)
 
         # Border container
-        self._border = tk.Frame(self, bg=Theme.get_color("BORDER_COLOR"), padx=1, pady=1)
+        self._border = tk.Frame(self, bg=c.BORDER_COLOR, padx=1, pady=1)
         self._border.pack(fill="x", expand=True)
 
         # Inner container
-        self._inner = tk.Frame(self._border, bg=Theme.get_color("BG_INPUT"))
+        self._inner = tk.Frame(self._border, bg=c.BG_INPUT)
         self._inner.pack(fill="x", expand=True)
 
         # Entry
         self._entry = tk.Entry(
             self._inner,
-            bg=Theme.get_color("BG_INPUT"),
-            fg=Theme.get_color("TEXT_PRIMARY"),
-            insertbackground=Theme.get_color("TEXT_PRIMARY"),
+            bg=c.BG_INPUT,
+            fg=c.TEXT_PRIMARY,
+            insertbackground=c.TEXT_PRIMARY,
             relief="flat",
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY),
+            font=FONT_BODY,
             textvariable=textvariable,
             show=show,
             **kwargs
         )
         self._entry.pack(fill="x", padx=10, pady=8)
 
+        # Static colors follow theme switches
+        ThemeApplier.register_options(self, bg="BG_CARD")
+        ThemeApplier.register_options(self._inner, bg="BG_INPUT")
+        ThemeApplier.register_options(self._entry, bg="BG_INPUT", insertbackground="TEXT_PRIMARY")
+        # Foreground and border depend on state, so they are re-derived here
+        Theme.add_observer(self._refresh_palette)
+
         if placeholder and textvariable and not textvariable.get():
             self._show_placeholder()
 
         self._entry.bind("<FocusIn>", self._on_focus_in)
         self._entry.bind("<FocusOut>", self._on_focus_out)
 
-        if validate_func and textvariable:
-            textvariable.trace_add("write", self._on_change)
+        if textvariable is not None:
+            # Catches typing as well as textvariable.set() from code
+            VarBus.subscribe(textvariable, self._on_var_write)
+        elif validate_func:
+            self._entry.config(
+                validate="key",
+                validatecommand=(self.register(self._validate_key), "%P")
+            )
 
         if tooltip:
             Tooltip(self._entry, tooltip)
 
+    def _set_entry_style(self, fg: str, show: str) -> None:
+        """Configure the entry only when foreground or show char change."""
+        style = (fg, show)
+        if style != self._entry_style:
+            self._entry_style = style
+            self._entry.config(fg=fg, show=show)
+
     def _show_placeholder(self) -> None:
-        self._entry.config(fg=Theme.get_color("TEXT_MUTED"), show="")
-        self._entry.delete(0, "end")
-        self._entry.insert(0, self._placeholder)
+        self._showing_placeholder = True
+        self._set_entry_style(COLORS["TEXT_MUTED"], "")
+        self._writing_placeholder = True
+        try:
+            self._entry.delete(0, "end")
+            self._entry.insert(0, self._placeholder)
+        finally:
+            self._writing_placeholder = False
 
     def _hide_placeholder(self) -> None:
-        self._entry.config(fg=Theme.get_color("TEXT_PRIMARY"), show=self._show_char)
-        if self._entry.get() == self._placeholder:
-            self._entry.delete(0, "end")
+        self._set_entry_style(COLORS["TEXT_PRIMARY"], self._show_char)
+        if self._showing_placeholder:
+            self._showing_placeholder = False
+            # Only ever clear the placeholder itself, never a real value
+            if self._entry.get() == self._placeholder:
+                self._writing_placeholder = True
+                try:
+                    self._entry.delete(0, "end")
+                finally:
+                    self._writing_placeholder = False
 
     def _on_focus_in(self, event: tk.Event) -> None:
         self._has_focus = True
-        self._border.config(bg=Theme.get_color("BORDER_FOCUS"))
-        if self._entry.get() == self._placeholder:
+        self._update_border()
+        if self._showing_placeholder:
             self._hide_placeholder()
 
     def _on_focus_out(self, event: tk.Event) -> None:
@@ -138,25 +343,83 @@ class ModernEntry(tk.Frame):
         if not self._entry.get():
             self._show_placeholder()
 
-    def _on_change(self, *args) -> None:
-        if self._validate_func and self._textvariable:
-            value = self._textvariable.get()
-            if value and value != self._placeholder:
-                self._is_valid = self._validate_func(value)
+    def _validate_key(self, new_value: str) -> bool:
+        """Tk validatecommand hook; never rejects input, only queues a check."""
+        self._schedule_validation(new_value)
+        return True
+
+    def _on_var_write(self) -> None:
+        if self._writing_placeholder:
+            return
+        value = self._textvariable.get()
+        if self._showing_placeholder and value:
+            # A real value was written from code over the placeholder
+            self._showing_placeholder = False
+            self._set_entry_style(COLORS["TEXT_PRIMARY"], self._show_char)
+        if self._validate_func:
+            self._schedule_validation(value)
+
+    def _schedule_validation(self, value: str) -> None:
+        self._pending_value = value
+        # Validate once per typing burst rather than on every keystroke
+        if self._validate_after_id is not None:
+            self._entry.after_cancel(self._validate_after_id)
+        self._validate_after_id = self._entry.after(150, self._run_validation)
+
+    def _run_validation(self) -> None:
+        """Submit the validator to the worker thread; the Tk thread polls for the result."""
+        self._validate_after_id = None
+        value = self._pending_value
+        if not (self._validate_func and value and not self._showing_placeholder):
+            # Nothing to check: drop any in-flight result and a stale border
+            self._validation_seq += 1
+            if self._is_valid is not None:
+                self._is_valid = None
                 self._update_border()
+            return
+
+        self._validation_seq += 1
+        seq = self._validation_seq
+        future = _validation_pool().submit(self._validate_func, value)
+        # Tk must only be touched from its own thread, so no done callback
+        self._entry.after(self.VALIDATION_POLL_MS, self._poll_validation, seq, future)
+
+    def _poll_validation(self, seq: int, future: Future) -> None:
+        if seq != self._validation_seq:
+            return  # A newer value is already being validated
+        if not self._entry.winfo_exists():
+            return  # Widget destroyed while validating
+        if not future.done():
+            self._entry.after(self.VALIDATION_POLL_MS, self._poll_validation, seq, future)
+            return
+        try:
+            self._is_valid = bool(future.result())
+        except Exception:
+            return
+        self._update_border()
+
+    def _refresh_palette(self) -> None:
+        """Re-apply the foreground and border colors after a theme switch."""
+        fg = COLORS["TEXT_MUTED"] if self._showing_placeholder else COLORS["TEXT_PRIMARY"]
+        self._entry_style = (fg, self._entry_style[1])
+        self._entry.config(fg=fg)
+        # The cached border color belongs to the old palette
+        self._last_border_color = ""
+        self._update_border()
 
     def _update_border(self) -> None:
         if self._has_focus:
-            color = Theme.get_color("BORDER_FOCUS")
+            color = COLORS["BORDER_FOCUS"]
         elif self._is_valid is False:
-            color = Theme.get_color("BORDER_ERROR")
+            color = COLORS["BORDER_ERROR"]
         else:
-            color = Theme.get_color("BORDER_COLOR")
-        self._border.config(bg=color)
+            color = COLORS["BORDER_COLOR"]
+        if color != self._last_border_color:
+            self._last_border_color = color
+            self._border.config(bg=color)
 
     def get(self) -> str:
-        value = self._entry.get()
-        return "" if value == self._placeholder else value
+        return "" if self._showing_placeholder else self._entry.get()
 
 
 class PasswordEntry(tk.Frame):
@@ -166,33 +429,39 @@ class PasswordEntry(tk.Frame):
         self,
         parent: tk.Widget,
         placeholder: str = "",
-        textvariable: Optional[tk.StringVar] = None,
+        textvariable: tk.StringVar | None = None,
         tooltip: str = "",
         **kwargs
     ) -> None:
-        super().__init__(parent, bg=Theme.get_color("BG_CARD"))
+        c = get_palette()
+        super().__init__(parent, bg=c.BG_CARD)
 
         self._placeholder = placeholder
+        self._showing_placeholder = False
+        # True while the placeholder itself is written into the entry
+        self._writing_placeholder = False
         self._has_focus = False
         self._is_visible = False
         self._textvariable = textvariable
+        self._last_border_color = c.BORDER_COLOR
+        self._entry_style = (c.TEXT_PRIMARY, "*")
 
         # Border
-        self._border = tk.Frame(self, bg=Theme.get_color("BORDER_COLOR"), padx=1, pady=1)
+        self._border = tk.Frame(self, bg=c.BORDER_COLOR, padx=1, pady=1)
         self._border.pack(fill="x", expand=True)
 
         # Inner
-        self._inner = tk.Frame(self._border, bg=Theme.get_color("BG_INPUT"))
+        self._inner = tk.Frame(self._border, bg=c.BG_INPUT)
         self._inner.pack(fill="x", expand=True)
 
         # Entry
         self._entry = tk.Entry(
             self._inner,
-            bg=Theme.get_color("BG_INPUT"),
-            fg=Theme.get_color("TEXT_PRIMARY"),
-            insertbackground=Theme.get_color("TEXT_PRIMARY"),
+            bg=c.BG_INPUT,
+            fg=c.TEXT_PRIMARY,
+            insertbackground=c.TEXT_PRIMARY,
             relief="flat",
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY),
+            font=FONT_BODY,
             textvariable=textvariable,
             show="*",
             **kwargs
@@ -203,18 +472,30 @@ class PasswordEntry(tk.Frame):
         self._toggle = tk.Label(
             self._inner,
             text="Show",
-            bg=Theme.get_color("BG_INPUT"),
-            fg=Theme.get_color("TEXT_MUTED"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL),
+            bg=c.BG_INPUT,
+            fg=c.TEXT_MUTED,
+            font=FONT_SMALL,
             cursor="hand2"
         )
         self._toggle.pack(side="right", padx=(5, 10), pady=8)
 
+        # Static colors follow theme switches
+        ThemeApplier.register_options(self, bg="BG_CARD")
+        ThemeApplier.register_options(self._inner, bg="BG_INPUT")
+        ThemeApplier.register_options(self._entry, bg="BG_INPUT", insertbackground="TEXT_PRIMARY")
+        ThemeApplier.register_options(self._toggle, bg="BG_INPUT")
+        # Foreground and border depend on state, so they are re-derived here
+        Theme.add_observer(self._refresh_palette)
+
+        if textvariable is not None:
+            # Values set from code (saved password) replace the placeholder
+            VarBus.subscribe(textvariable, self._on_var_write)
+
         self._entry.bind("<FocusIn>", self._on_focus_in)
         self._entry.bind("<FocusOut>", self._on_focus_out)
         self._toggle.bind("<Button-1>", self._toggle_visibility)
-        self._toggle.bind("<Enter>", lambda e: self._toggle.config(fg=Theme.get_color("TEXT_PRIMARY")))
-        self._toggle.bind("<Leave>", lambda e: self._toggle.config(fg=Theme.get_color("TEXT_MUTED")))
+        self._toggle.bind("<Enter>", lambda e: self._toggle.config(fg=COLORS["TEXT_PRIMARY"]))
+        self._toggle.bind("<Leave>", lambda e: self._toggle.config(fg=COLORS["TEXT_MUTED"]))
 
         if placeholder and textvariable and not textvariable.get():
             self._show_placeholder()
@@ -222,65 +503,198 @@ class PasswordEntry(tk.Frame):
         if tooltip:
             Tooltip(self._entry, tooltip)
 
+    def _set_entry_style(self, fg: str, show: str) -> None:
+        """Configure the entry only when foreground or show char change."""
+        style = (fg, show)
+        if style != self._entry_style:
+            self._entry_style = style
+            self._entry.config(fg=fg, show=show)
+
     def _show_placeholder(self) -> None:
-        self._entry.config(fg=Theme.get_color("TEXT_MUTED"), show="")
-        self._entry.delete(0, "end")
-        self._entry.insert(0, self._placeholder)
+        self._showing_placeholder = True
+        self._set_entry_style(COLORS["TEXT_MUTED"], "")
+        self._writing_placeholder = True
+        try:
+            self._entry.delete(0, "end")
+            self._entry.insert(0, self._placeholder)
+        finally:
+            self._writing_placeholder = False
 
     def _hide_placeholder(self) -> None:
-        self._entry.config(fg=Theme.get_color("TEXT_PRIMARY"))
-        if not self._is_visible:
-            self._entry.config(show="*")
-        if self._entry.get() == self._placeholder:
-            self._entry.delete(0, "end")
+        self._set_entry_style(COLORS["TEXT_PRIMARY"], "" if self._is_visible else "*")
+        if self._showing_placeholder:
+            self._showing_placeholder = False
+            # Only ever clear the placeholder itself, never a real value
+            if self._entry.get() == self._placeholder:
+                self._writing_placeholder = True
+                try:
+                    self._entry.delete(0, "end")
+                finally:
+                    self._writing_placeholder = False
+
+    def _on_var_write(self) -> None:
+        if self._writing_placeholder:
+            return
+        if self._showing_placeholder and self._textvariable.get():
+            # A real value was written from code over the placeholder
+            self._showing_placeholder = False
+            self._set_entry_style(COLORS["TEXT_PRIMARY"], "" if self._is_visible else "*")
+
+    def _refresh_palette(self) -> None:
+        """Re-apply the foreground and border colors after a theme switch."""
+        fg = COLORS["TEXT_MUTED"] if self._showing_placeholder else COLORS["TEXT_PRIMARY"]
+        self._entry_style = (fg, self._entry_style[1])
+        self._entry.config(fg=fg)
+        self._toggle.config(fg=COLORS["TEXT_MUTED"])
+        # The cached border color belongs to the old palette
+        self._last_border_color = ""
+        self._set_border(COLORS["BORDER_FOCUS"] if self._has_focus else COLORS["BORDER_COLOR"])
+
+    def _set_border(self, color: str) -> None:
+        if color != self._last_border_color:
+            self._last_border_color = color
+            self._border.config(bg=color)
 
     def _on_focus_in(self, event: tk.Event) -> None:
         self._has_focus = True
-        self._border.config(bg=Theme.get_color("BORDER_FOCUS"))
-        if self._entry.get() == self._placeholder:
+        self._set_border(COLORS["BORDER_FOCUS"])
+        if self._showing_placeholder:
             self._hide_placeholder()
 
     def _on_focus_out(self, event: tk.Event) -> None:
         self._has_focus = False
-        self._border.config(bg=Theme.get_color("BORDER_COLOR"))
+        self._set_border(COLORS["BORDER_COLOR"])
         if not self._entry.get():
             self._show_placeholder()
 
     def _toggle_visibility(self, event: tk.Event) -> None:
-        if self._entry.get() == self._placeholder:
+        if self._showing_placeholder:
             return
         self._is_visible = not self._is_visible
         if self._is_visible:
-            self._entry.config(show="")
+            self._set_entry_style(self._entry_style[0], "")
             self._toggle.config(text="Hide")
         else:
-            self._entry.config(show="*")
+            self._set_entry_style(self._entry_style[0], "*")
             self._toggle.config(text="Show")
 
     def get(self) -> str:
-        value = self._entry.get()
-        return "" if value == self._placeholder else value
+        return "" if self._showing_placeholder else self._entry.get()
+
+
+@lru_cache(maxsize=64)
+def _rounded_rect_parts(width: int, height: int, radius: int) -> tuple[tuple, tuple]:
+    """
+    Canvas coordinates for a rounded rectangle, cached per geometry.
+
+    Returns:
+        ((arc_box, start_angle) for each corner, (rect_box, rect_box))
+    """
+    d = radius * 2
+    w, h = width, height
+    arcs = (
+        ((0, 0, d, d), 90),
+        ((w - d, 0, w, d), 0),
+        ((w - d, h - d, w, h), 270),
+        ((0, h - d, d, h), 180),
+    )
+    rects = ((radius, 0, w - radius, h), (0, radius, w, h - radius))
+    return arcs, rects
+
+
+class VarBus:
+    """
+    Shared write-observer registry for Tk variables.
+
+    Each variable gets exactly one Tcl trace no matter how many widgets
+    listen to it; the trace fans out to the Python subscribers. Bound
+    method subscribers are held weakly so destroyed widgets drop out.
+    """
+
+    # Tcl variable name -> weak refs to zero-argument callbacks
+    _subscribers: dict[str, list[weakref.ReferenceType[Callable[[], None]]]] = {}
+
+    @classmethod
+    def subscribe(cls, variable: tk.Variable, callback: Callable[[], None]) -> None:
+        """
+        Call ``callback`` whenever ``variable`` is written.
+
+        Args:
+            variable: Tk variable to observe
+            callback: Zero-argument callable
+        """
+        name = str(variable)
+        refs = cls._subscribers.get(name)
+        if refs is None:
+            refs = cls._subscribers[name] = []
+            variable.trace_add("write", cls._on_write)
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            refs.append(weakref.WeakMethod(callback))
+        else:
+            refs.append(weakref.ref(callback))
+
+    @classmethod
+    def _on_write(cls, name: str, index: str, mode: str) -> None:
+        refs = cls._subscribers.get(name)
+        if not refs:
+            return
+        alive = []
+        for ref in refs:
+            callback = ref()
+            if callback is not None:
+                alive.append(ref)
+                callback()
+        refs[:] = alive
+
+
+class _IdleRedraw:
+    """
+    Mixin that coalesces repaint requests.
+
+    Any number of ``_request_redraw`` calls within one event loop turn
+    result in a single ``_redraw`` on the next idle tick.
+    """
 
+    _redraw_pending = False
+    # Repaint hook, defined by every subclass
+    _redraw: Callable[[], None]
 
-class ModernButton(tk.Canvas):
+    def _request_redraw(self) -> None:
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        self._redraw_pending = False
+        try:
+            self._redraw()
+        except tk.TclError:
+            pass  # Widget destroyed before the idle tick
+
+
+class ModernButton(_IdleRedraw, tk.Canvas):
     """Clean button with hover effect."""
 
+    BG_TAG = "bg"
+    TEXT_TAG = "text"
+
     def __init__(
         self,
         parent: tk.Widget,
         text: str = "",
-        command: Optional[Callable] = None,
+        command: Callable | None = None,
         primary: bool = True,
         width: int = 120,
         height: int = 36,
         tooltip: str = "",
         **kwargs
     ) -> None:
+        c = get_palette()
         super().__init__(
             parent,
             width=width,
             height=height,
-            bg=Theme.get_color("BG_CARD"),
+            bg=c.BG_CARD,
             highlightthickness=0,
             **kwargs
         )
@@ -293,7 +707,17 @@ class ModernButton(tk.Canvas):
         self._enabled = True
         self._hovered = False
 
-        self._draw()
+        # Palette snapshot, swapped by _refresh_palette on theme change
+        self._c = c
+
+        # (primary, enabled, hovered) -> (bg, fg), dropped on theme change
+        self._color_cache: dict[tuple[bool, bool, bool], tuple[str, str]] = {}
+        Theme.add_observer(self._refresh_palette)
+
+        self._text_id = 0
+        self._last_colors: tuple[str, str] = ("", "")
+        self._build()
+        ThemeApplier.register_options(self, bg="BG_CARD")
 
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
@@ -302,53 +726,82 @@ class ModernButton(tk.Canvas):
         if tooltip:
             Tooltip(self, tooltip)
 
-    def _draw(self) -> None:
-        self.delete("all")
+    def _refresh_palette(self) -> None:
+        self._c = get_palette()
+        self._color_cache.clear()
+        self._request_redraw()
+
+    def _resolve_colors(self) -> tuple[str, str]:
+        """Return the (bg, fg) pair for the current button state."""
+        key = (self._primary, self._enabled, self._hovered)
+        colors = self._color_cache.get(key)
+        if colors is not None:
+            return colors
 
+        c = self._c
         if self._primary:
-            bg = Theme.get_color("BTN_PRIMARY_BG")
-            fg = Theme.get_color("BTN_PRIMARY_FG")
-            hover = Theme.get_color("BTN_PRIMARY_HOVER")
+            bg = c.BTN_PRIMARY_BG
+            fg = c.BTN_PRIMARY_FG
+            hover = c.BTN_PRIMARY_HOVER
         else:
-            bg = Theme.get_color("BTN_SECONDARY_BG")
-            fg = Theme.get_color("BTN_SECONDARY_FG")
-            hover = Theme.get_color("BTN_SECONDARY_HOVER")
+            bg = c.BTN_SECONDARY_BG
+            fg = c.BTN_SECONDARY_FG
+            hover = c.BTN_SECONDARY_HOVER
 
         if not self._enabled:
-            bg = Theme.get_color("BTN_DISABLED_BG")
-            fg = Theme.get_color("BTN_DISABLED_FG")
+            bg = c.BTN_DISABLED_BG
+            fg = c.BTN_DISABLED_FG
         elif self._hovered:
             bg = hover
 
-        # Rectangle with slight rounding
-        r = 4
-        self.create_polygon(
-            r, 0, self._width - r, 0,
-            self._width, 0, self._width, r,
-            self._width, self._height - r, self._width, self._height,
-            self._width - r, self._height, r, self._height,
-            0, self._height, 0, self._height - r,
-            0, r, 0, 0,
-            smooth=True, fill=bg, outline=""
-        )
+        colors = self._color_cache[key] = (bg, fg)
+        return colors
+
+    def _build(self) -> None:
+        """Create the canvas items; later state changes only recolor them."""
+        bg, fg = self._last_colors = self._resolve_colors()
+
+        # Rounded rectangle: four quarter-circle corners plus two
+        # overlapping rectangles, all sharing the BG_TAG for recoloring
+        arcs, rects = _rounded_rect_parts(self._width, self._height, 4)
+        tag = self.BG_TAG
+        for box, start in arcs:
+            self.create_arc(
+                box, start=start, extent=90,
+                style="pieslice", fill=bg, outline="", tags=tag
+            )
+        for box in rects:
+            self.create_rectangle(box, fill=bg, outline="", tags=tag)
 
-        self.create_text(
+        self._text_id = self.create_text(
             self._width // 2,
             self._height // 2,
             text=self._text,
             fill=fg,
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            font=_named_font(FONT_BODY),
+            tags=self.TEXT_TAG
         )
 
+    def _recolor(self) -> None:
+        colors = self._resolve_colors()
+        if colors == self._last_colors:
+            return  # e.g. <Leave> on a button that was never hovered
+        self._last_colors = colors
+        bg, fg = colors
+        self.itemconfig(self.BG_TAG, fill=bg)
+        self.itemconfig(self._text_id, fill=fg)
+
+    _redraw = _recolor
+
     def _on_enter(self, event: tk.Event) -> None:
         if self._enabled:
             self._hovered = True
-            self._draw()
+            self._request_redraw()
             self.config(cursor="hand2")
 
     def _on_leave(self, event: tk.Event) -> None:
         self._hovered = False
-        self._draw()
+        self._request_redraw()
         self.config(cursor="")
 
     def _on_click(self, event: tk.Event) -> None:
@@ -357,75 +810,106 @@ class ModernButton(tk.Canvas):
 
     def set_enabled(self, enabled: bool) -> None:
         self._enabled = enabled
-        self._draw()
+        self._request_redraw()
 
     def set_text(self, text: str) -> None:
         self._text = text
-        self._draw()
+        self.itemconfig(self._text_id, text=text)
 
 
-class ModernCheckbox(tk.Frame):
+class ModernCheckbox(_IdleRedraw, tk.Frame):
     """Clean checkbox widget."""
 
     def __init__(
         self,
         parent: tk.Widget,
         text: str = "",
-        variable: Optional[tk.BooleanVar] = None,
-        command: Optional[Callable] = None,
+        variable: tk.BooleanVar | None = None,
+        command: Callable | None = None,
         tooltip: str = "",
         **kwargs
     ) -> None:
-        super().__init__(parent, bg=Theme.get_color("BG_CARD"))
+        c = get_palette()
+        super().__init__(parent, bg=c.BG_CARD)
 
         self._variable = variable or tk.BooleanVar()
         self._command = command
 
         self._canvas = tk.Canvas(
             self, width=16, height=16,
-            bg=Theme.get_color("BG_CARD"),
+            bg=c.BG_CARD,
             highlightthickness=0
         )
         self._canvas.pack(side="left", padx=(0, 8))
 
         self._label = tk.Label(
             self, text=text,
-            bg=Theme.get_color("BG_CARD"),
-            fg=Theme.get_color("TEXT_PRIMARY"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            bg=c.BG_CARD,
+            fg=c.TEXT_PRIMARY,
+            font=_named_font(FONT_BODY)
         )
         self._label.pack(side="left")
 
-        self._draw()
+        # Palette snapshot, swapped by _refresh_palette on theme change
+        self._c = c
+
+        # checked -> (fill, outline), dropped on theme change
+        self._color_cache: dict[bool, tuple[str, str]] = {}
+        Theme.add_observer(self._refresh_palette)
+
+        self._box_id = 0
+        self._check_id = 0
+        self._build()
+
+        # Static colors follow theme switches
+        ThemeApplier.register_options(self, bg="BG_CARD")
+        ThemeApplier.register_options(self._canvas, bg="BG_CARD")
+        ThemeApplier.register_options(self._label, bg="BG_CARD", fg="TEXT_PRIMARY")
 
         self._canvas.bind("<Button-1>", self._toggle)
         self._label.bind("<Button-1>", self._toggle)
-        self._variable.trace_add("write", lambda *a: self._draw())
+        VarBus.subscribe(self._variable, self._on_var_write)
 
         if tooltip:
             Tooltip(self, tooltip)
 
-    def _draw(self) -> None:
-        self._canvas.delete("all")
+    def _refresh_palette(self) -> None:
+        self._c = get_palette()
+        self._color_cache.clear()
+        self._request_redraw()
 
-        if self._variable.get():
-            self._canvas.create_rectangle(
-                1, 1, 15, 15,
-                fill=Theme.get_color("ACCENT_PRIMARY"),
-                outline=""
-            )
-            # Checkmark
-            self._canvas.create_line(
-                4, 8, 7, 11, 12, 4,
-                fill="#fff", width=2, capstyle="round", joinstyle="round"
-            )
-        else:
-            self._canvas.create_rectangle(
-                1, 1, 15, 15,
-                fill=Theme.get_color("BG_INPUT"),
-                outline=Theme.get_color("BORDER_COLOR"),
-                width=1
-            )
+    def _build(self) -> None:
+        """Create the box and checkmark once; toggling only recolors them."""
+        canvas = self._canvas
+
+        self._box_id = canvas.create_rectangle(1, 1, 15, 15, width=1, tags="box")
+        # Checkmark
+        self._check_id = canvas.create_line(
+            4, 8, 7, 11, 12, 4,
+            fill="#fff", width=2, capstyle="round", joinstyle="round", tags="check"
+        )
+        self._recolor()
+
+    def _recolor(self) -> None:
+        checked = bool(self._variable.get())
+        colors = self._color_cache.get(checked)
+        if colors is None:
+            if checked:
+                # Border in the fill color keeps the box size identical in both states
+                colors = (self._c.ACCENT_PRIMARY, self._c.ACCENT_PRIMARY)
+            else:
+                colors = (self._c.BG_INPUT, self._c.BORDER_COLOR)
+            self._color_cache[checked] = colors
+        fill, outline = colors
+
+        canvas = self._canvas
+        canvas.itemconfig(self._box_id, fill=fill, outline=outline)
+        canvas.itemconfig(self._check_id, state="normal" if checked else "hidden")
+
+    _redraw = _recolor
+
+    def _on_var_write(self) -> None:
+        self._request_redraw()
 
     def _toggle(self, event: tk.Event) -> None:
         self._variable.set(not self._variable.get())
@@ -433,16 +917,25 @@ class ModernCheckbox(tk.Frame):
             self._command()
 
 
-class ThemeToggle(tk.Frame):
+class ThemeToggle(_IdleRedraw, tk.Frame):
     """Simple dark/light theme toggle."""
 
+    WIDTH = 40
+    HEIGHT = 20
+
+    # Tk interpreter -> {(track color, is_dark) -> rendered track + knob image}.
+    # Images only exist in the interpreter that created them, so each root
+    # gets its own cache, dropped when that root is destroyed.
+    _sprites: dict[object, dict[tuple[str, bool], tk.PhotoImage]] = {}
+
     def __init__(
         self,
         parent: tk.Widget,
-        command: Optional[Callable[[bool], None]] = None,
+        command: Callable[[bool], None] | None = None,
         **kwargs
     ) -> None:
-        super().__init__(parent, bg=Theme.get_color("BG_CARD"))
+        c = get_palette()
+        super().__init__(parent, bg=c.BG_CARD)
 
         self._command = command
         self._is_dark = Theme.is_dark_mode()
@@ -450,39 +943,102 @@ class ThemeToggle(tk.Frame):
         self._label = tk.Label(
             self,
             text="Dark mode",
-            bg=Theme.get_color("BG_CARD"),
-            fg=Theme.get_color("TEXT_PRIMARY"),
-            font=(Theme.FONT_FAMILY, Theme.FONT_SIZE_BODY)
+            bg=c.BG_CARD,
+            fg=c.TEXT_PRIMARY,
+            font=FONT_BODY
         )
         self._label.pack(side="left", padx=(0, 10))
 
         self._canvas = tk.Canvas(
-            self, width=40, height=20,
-            bg=Theme.get_color("BG_CARD"),
+            self, width=self.WIDTH, height=self.HEIGHT,
+            bg=c.BG_CARD,
             highlightthickness=0
         )
         self._canvas.pack(side="left")
 
+        # Static colors follow theme switches
+        ThemeApplier.register_options(self, bg="BG_CARD")
+        ThemeApplier.register_options(self._canvas, bg="BG_CARD")
+        ThemeApplier.register_options(self._label, bg="BG_CARD", fg="TEXT_PRIMARY")
+
+        # Palette snapshot, swapped by _refresh_palette on theme change
+        self._c = c
+
+        # is_dark -> track color, dropped on theme change
+        self._color_cache: dict[bool, str] = {}
+        Theme.add_observer(self._refresh_palette)
+
+        self._img_id: int | None = None
         self._draw()
 
         self._canvas.bind("<Button-1>", self._toggle)
         self._label.bind("<Button-1>", self._toggle)
 
+    def _refresh_palette(self) -> None:
+        self._c = get_palette()
+        self._color_cache.clear()
+        self._request_redraw()
+
+    def _sprite_cache(self) -> dict[tuple[str, bool], tk.PhotoImage]:
+        """Return the sprite cache of this widget's Tk interpreter."""
+        interp = self.tk
+        cache = self._sprites.get(interp)
+        if cache is None:
+            cache = self._sprites[interp] = {}
+            root = self._root()
+
+            def forget(event: tk.Event) -> None:
+                if event.widget is root:
+                    ThemeToggle._sprites.pop(interp, None)
+
+            root.bind("<Destroy>", forget, add="+")
+        return cache
+
+    def _render_sprite(self, color: str, is_dark: bool) -> tk.PhotoImage:
+        """
+        Rasterize the pill track and knob for one state.
+
+        Each row is filled with two put() calls (track span, then knob
+        span); pixels outside the pill stay transparent.
+        """
+        w, h = self.WIDTH, self.HEIGHT
+        r = h / 2
+        knob_r = r - 2
+        knob_cx = (w - r if is_dark else r)
+        # Owned by the root so the image outlives this particular toggle
+        image = tk.PhotoImage(master=self._root(), width=w, height=h)
+        for y in range(h):
+            dy = y + 0.5 - r
+            half = math.sqrt(r * r - dy * dy)
+            image.put(color, to=(round(r - half), y, round(w - r + half), y + 1))
+            if abs(dy) < knob_r:
+                k = math.sqrt(knob_r * knob_r - dy * dy)
+                image.put("#fff", to=(round(knob_cx - k), y, round(knob_cx + k), y + 1))
+        return image
+
     def _draw(self) -> None:
-        self._canvas.delete("all")
+        is_dark = self._is_dark
+
+        color = self._color_cache.get(is_dark)
+        if color is None:
+            color = self._c.ACCENT_PRIMARY if is_dark else self._c.BORDER_COLOR
+            self._color_cache[is_dark] = color
 
-        # Track
-        color = Theme.get_color("ACCENT_PRIMARY") if self._is_dark else Theme.get_color("BORDER_COLOR")
-        self._canvas.create_oval(0, 0, 20, 20, fill=color, outline="")
-        self._canvas.create_oval(20, 0, 40, 20, fill=color, outline="")
-        self._canvas.create_rectangle(10, 0, 30, 20, fill=color, outline="")
+        sprites = self._sprite_cache()
+        key = (color, is_dark)
+        image = sprites.get(key)
+        if image is None:
+            image = sprites[key] = self._render_sprite(color, is_dark)
 
-        # Knob
-        x = 22 if self._is_dark else 2
-        self._canvas.create_oval(x, 2, x + 16, 18, fill="#fff", outline="")
+        if self._img_id is None:
+            self._img_id = self._canvas.create_image(0, 0, anchor="nw", image=image)
+        else:
+            self._canvas.itemconfig(self._img_id, image=image)
+
+    _redraw = _draw
 
     def _toggle(self, event: tk.Event) -> None:
         self._is_dark = not self._is_dark
-        self._draw()
+        self._request_redraw()
         if self._command:
             self._command(self._is_dark)
@@ -1,20 +1,46 @@
 """
 Utility modules for EPLAN eVIEW Extractor.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+one utility does not pull in the others. ``print_from_link`` needs lxml.
 """
 
-from .logging import FileLogger, LogLevel, get_logger
-from .retry import retry_with_backoff
-from .i18n import I18n, t
-from .notifications import NotificationManager
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "FileLogger": "logging",
+    "LogLevel": "logging",
+    "get_logger": "logging",
+    "retry_with_backoff": "retry",
+    "CircuitOpenError": "retry",
+    "I18n": "i18n",
+    "t": "i18n",
+    "NotificationManager": "notifications",
+    "print_from_link": "helpers",
+    "normalize_whitespace": "helpers",
+}
+
+
+def __getattr__(name: str):
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-# Note: helpers module requires bs4, import explicitly when needed
-# from .helpers import print_from_link
 
 __all__ = [
     "FileLogger",
     "LogLevel",
     "get_logger",
     "retry_with_backoff",
+    "CircuitOpenError",
     "I18n",
     "t",
     "NotificationManager",
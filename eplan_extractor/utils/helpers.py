@@ -2,31 +2,58 @@
 Utility helper functions.
 """
 
+import re
 from urllib.request import urlopen
 
-from bs4 import BeautifulSoup
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = etree = None
 
+# A line break or a run of two or more spaces, with the whitespace around it.
+# Replacing matches with one newline splits the text into stripped, non-empty
+# chunks in a single pass.
+_BREAK_RE = re.compile(r"\s*(?:[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]| {2})\s*")
 
-def print_from_link(url: str) -> None:
+
+def normalize_whitespace(text: str) -> str:
     """
-    Extract and print text content from a URL.
+    Split text at line breaks and double spaces into stripped, non-empty lines.
 
     Args:
-        url: URL to fetch and parse
+        text: Raw text, e.g. from an HTML document
+
+    Returns:
+        The chunks joined with newlines
     """
-    html = urlopen(url).read()
-    soup = BeautifulSoup(html, features="html.parser")
+    return _BREAK_RE.sub("\n", text).strip()
 
-    # Remove script and style elements
-    for element in soup(["script", "style"]):
-        element.extract()
 
-    # Get text
-    text = soup.get_text()
+def print_from_link(url: str) -> None:
+    """
+    Extract and print text content from a URL.
 
-    # Clean up whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = "\n".join(chunk for chunk in chunks if chunk)
+    Args:
+        url: URL to fetch and parse
 
-    print(text)
+    Raises:
+        ImportError: If lxml is not installed
+    """
+    if lxml is None:
+        raise ImportError("print_from_link requires lxml (pip install lxml)")
+
+    # lxml reads the response in chunks and parses as data arrives; the
+    # connection is closed as soon as the tree is built
+    with urlopen(url) as response:
+        root = lxml.html.parse(response).getroot()
+
+    if root is None:  # Empty document
+        text = ""
+    else:
+        # Remove script and style elements in one native tree walk,
+        # keeping the text that follows them
+        etree.strip_elements(root, "script", "style", with_tail=False)
+        text = root.text_content()
+
+    print(normalize_whitespace(text))
@@ -4,10 +4,14 @@ Thread-safe file logging system with rotation support.
 
 from __future__ import annotations
 
+import atexit
+import queue
+import sys
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Optional
 
 from ..constants import DEBUG, LOG_BACKUP_COUNT, LOG_FILE, LOG_MAX_SIZE, VERSION
 
@@ -21,6 +25,16 @@ class LogLevel:
     SUCCESS = "SUCCESS"
 
 
+# Severity used for the level threshold; SUCCESS is an INFO-level outcome
+_LEVEL_RANKS: Dict[str, int] = {
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.SUCCESS: 20,
+    LogLevel.WARNING: 30,
+    LogLevel.ERROR: 40,
+}
+
+
 class FileLogger:
     """
     Thread-safe file logger with rotation support.
@@ -31,6 +45,9 @@ class FileLogger:
     _instance: Optional[FileLogger] = None
     _lock: threading.Lock = threading.Lock()
 
+    # Buffered lines are pushed to disk after this many writes
+    FLUSH_EVERY = 32
+
     def __new__(cls) -> FileLogger:
         """Singleton pattern for logger instance."""
         if cls._instance is None:
@@ -47,17 +64,46 @@ class FileLogger:
 
         self._initialized = True
         self._log_file = Path(LOG_FILE)
-        self._callbacks: List[Callable[[str, str], None]] = []
+        # Insertion-ordered set: O(1) add/remove, stable call order
+        self._callbacks: Dict[Callable[[str, str], None], None] = {}
         self._file_lock = threading.Lock()
+        self._pending_writes = 0
+        # Messages below this rank are dropped before they are formatted
+        self._min_rank = _LEVEL_RANKS[LogLevel.DEBUG if DEBUG else LogLevel.INFO]
+        # (epoch second, formatted timestamp); swapped as one tuple so
+        # concurrent log() calls never see a mismatched pair
+        self._ts_cache = (-1, "")
 
-        # Rotate log if too large
+        # Rotate log if too large, before the file is held open
         self._rotate_if_needed()
 
+        # One append handle for the whole session instead of open/close per line
+        self._fh = None
+        self._bytes_written = 0
+        self._open()
+        atexit.register(self.close)
+
+        # Formatted lines waiting for the writer thread, so log() never blocks on disk
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._writer.start()
+
         # Write startup marker
-        self._write_to_file(f"\n{'='*60}\n")
-        self._write_to_file(f"EPLAN Extractor v{VERSION} - Session Started\n")
-        self._write_to_file(f"Timestamp: {datetime.now().isoformat()}\n")
-        self._write_to_file(f"{'='*60}\n\n")
+        self._queue.put_nowait(
+            f"\n{'='*60}\n"
+            f"EPLAN Extractor v{VERSION} - Session Started\n"
+            f"Timestamp: {datetime.now().isoformat()}\n"
+            f"{'='*60}\n\n"
+        )
+
+    def _open(self) -> None:
+        """Open the append handle; its start position is the current file size."""
+        try:
+            self._fh = open(self._log_file, "a", encoding="utf-8", buffering=8192)
+            self._bytes_written = self._fh.tell()
+        except IOError as e:
+            print(f"Failed to open log file: {e}")
+            self._fh = None
 
     def _rotate_if_needed(self) -> None:
         """Rotate log file if it exceeds maximum size."""
@@ -65,39 +111,115 @@ class FileLogger:
             return
 
         if self._log_file.stat().st_size > LOG_MAX_SIZE:
-            # Rotate existing backups
-            for i in range(LOG_BACKUP_COUNT - 1, 0, -1):
-                old_backup = self._log_file.with_suffix(f".log.{i}")
-                new_backup = self._log_file.with_suffix(f".log.{i + 1}")
-                if old_backup.exists():
-                    if new_backup.exists():
-                        new_backup.unlink()
-                    old_backup.rename(new_backup)
-
-            # Move current log to first backup
-            backup_path = self._log_file.with_suffix(".log.1")
-            if backup_path.exists():
-                backup_path.unlink()
-            self._log_file.rename(backup_path)
+            self._rotate_files()
+
+    def _rotate_files(self) -> None:
+        """Shift the backups up by one and move the current log to .log.1."""
+        # Rotate existing backups
+        for i in range(LOG_BACKUP_COUNT - 1, 0, -1):
+            old_backup = self._log_file.with_suffix(f".log.{i}")
+            new_backup = self._log_file.with_suffix(f".log.{i + 1}")
+            if old_backup.exists():
+                if new_backup.exists():
+                    new_backup.unlink()
+                old_backup.rename(new_backup)
+
+        # Move current log to first backup
+        backup_path = self._log_file.with_suffix(".log.1")
+        if backup_path.exists():
+            backup_path.unlink()
+        self._log_file.rename(backup_path)
+
+    def _rollover(self) -> None:
+        """Rotate mid-session. Caller holds the file lock."""
+        try:
+            self._fh.close()
+            self._rotate_files()
+        except OSError as e:
+            print(f"Failed to rotate log file: {e}", file=sys.stderr)
+            self._open()
+            # Keep appending and retry after another LOG_MAX_SIZE bytes
+            # instead of on every following line
+            self._bytes_written = 0
+            return
+        self._open()
 
     def _write_to_file(self, message: str) -> None:
         """Write a message to the log file (thread-safe)."""
         with self._file_lock:
+            if self._fh is None:
+                return
             try:
-                with open(self._log_file, "a", encoding="utf-8") as f:
-                    f.write(message)
+                # Track the size in memory instead of stat()ing per write
+                size = len(message.encode("utf-8"))
+                if self._bytes_written and self._bytes_written + size > LOG_MAX_SIZE:
+                    self._rollover()
+                    if self._fh is None:
+                        return
+                self._fh.write(message)
+                self._bytes_written += size
+                self._pending_writes += 1
+                if self._pending_writes >= self.FLUSH_EVERY:
+                    self._fh.flush()
+                    self._pending_writes = 0
             except IOError as e:
                 print(f"Failed to write to log file: {e}")
 
+    def _drain(self) -> None:
+        """Writer thread: move queued lines to the log file."""
+        get = self._queue.get
+        while True:
+            message = get()
+            try:
+                self._write_to_file(message)
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued message is written and pushed to disk."""
+        self._queue.join()
+        with self._file_lock:
+            if self._fh is None:
+                return
+            try:
+                self._fh.flush()
+                self._pending_writes = 0
+            except IOError:
+                pass
+
+    def close(self) -> None:
+        """Flush and close the log file; later messages are not written to disk."""
+        self.flush()
+        with self._file_lock:
+            if self._fh is None:
+                return
+            try:
+                self._fh.close()
+            except IOError:
+                pass
+            self._fh = None
+
     def add_callback(self, callback: Callable[[str, str], None]) -> None:
         """Add a callback function to receive log messages."""
-        if callback not in self._callbacks:
-            self._callbacks.append(callback)
+        self._callbacks[callback] = None
 
     def remove_callback(self, callback: Callable[[str, str], None]) -> None:
         """Remove a callback function."""
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        self._callbacks.pop(callback, None)
+
+    def set_level(self, level: str) -> None:
+        """
+        Set the minimum level that is logged.
+
+        Args:
+            level: Lowest level to keep (DEBUG, INFO, WARNING, ERROR, SUCCESS);
+                defaults to DEBUG in debug mode and INFO otherwise
+        """
+        self._min_rank = _LEVEL_RANKS[level]
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether messages of the given level are logged."""
+        return _LEVEL_RANKS[level] >= self._min_rank
 
     def log(self, message: str, level: str = LogLevel.INFO) -> None:
         """
@@ -107,39 +229,62 @@ class FileLogger:
             message: The message to log
             level: Log level (DEBUG, INFO, WARNING, ERROR, SUCCESS)
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted = f"[{timestamp}] [{level}] {message}"
+        # Levels outside LogLevel are always kept
+        if _LEVEL_RANKS.get(level, self._min_rank) < self._min_rank:
+            return
+
+        sec = int(time.time())
+        cached_sec, timestamp = self._ts_cache
+        if sec != cached_sec:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._ts_cache = (sec, timestamp)
+        formatted = "".join(("[", timestamp, "] [", level, "] ", message, "\n"))
 
-        # Write to file
-        self._write_to_file(formatted + "\n")
+        # Hand off to the writer thread
+        self._queue.put_nowait(formatted)
 
         # Notify callbacks
-        for callback in self._callbacks:
+        # Snapshot: other threads may add or remove callbacks meanwhile
+        for callback in tuple(self._callbacks):
             try:
                 callback(message, level)
             except Exception:
                 pass  # Don't let callback errors break logging
 
-    def debug(self, message: str) -> None:
-        """Log a debug message."""
-        if DEBUG:
-            self.log(message, LogLevel.DEBUG)
+    def debug(self, message: str, *args: object) -> None:
+        """
+        Log a debug message.
+
+        Pass format arguments separately (``debug("Loaded %d entries", n)``)
+        so nothing is formatted when the level threshold drops the message.
+        """
+        if not self.is_enabled_for(LogLevel.DEBUG):
+            return
+        self.log(message % args if args else message, LogLevel.DEBUG)
 
-    def info(self, message: str) -> None:
-        """Log an info message."""
-        self.log(message, LogLevel.INFO)
+    def info(self, message: str, *args: object) -> None:
+        """Log an info message; ``args`` are %-formatted into it if it is kept."""
+        if not self.is_enabled_for(LogLevel.INFO):
+            return
+        self.log(message % args if args else message, LogLevel.INFO)
 
-    def warning(self, message: str) -> None:
-        """Log a warning message."""
-        self.log(message, LogLevel.WARNING)
+    def warning(self, message: str, *args: object) -> None:
+        """Log a warning message; ``args`` are %-formatted into it if it is kept."""
+        if not self.is_enabled_for(LogLevel.WARNING):
+            return
+        self.log(message % args if args else message, LogLevel.WARNING)
 
-    def error(self, message: str) -> None:
-        """Log an error message."""
-        self.log(message, LogLevel.ERROR)
+    def error(self, message: str, *args: object) -> None:
+        """Log an error message; ``args`` are %-formatted into it if it is kept."""
+        if not self.is_enabled_for(LogLevel.ERROR):
+            return
+        self.log(message % args if args else message, LogLevel.ERROR)
 
-    def success(self, message: str) -> None:
-        """Log a success message."""
-        self.log(message, LogLevel.SUCCESS)
+    def success(self, message: str, *args: object) -> None:
+        """Log a success message; ``args`` are %-formatted into it if it is kept."""
+        if not self.is_enabled_for(LogLevel.SUCCESS):
+            return
+        self.log(message % args if args else message, LogLevel.SUCCESS)
 
 
 def get_logger() -> FileLogger:
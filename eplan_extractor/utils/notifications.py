@@ -4,16 +4,70 @@ Desktop notifications module for cross-platform notifications.
 
 import platform
 import subprocess
-import threading
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+from xml.sax.saxutils import escape as _xml_escape
 
 from .i18n import t
 
+# The platform never changes while running; resolve it once at import
+_SYSTEM = platform.system().lower()
+
+# Toast script for the PowerShell fallback; {title} and {message} must be
+# passed through _ps_toast_text first
+_PS_TOAST_SCRIPT = '''
+[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
+[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
+
+$template = @"
+<toast>
+    <visual>
+        <binding template="ToastText02">
+            <text id="1">{title}</text>
+            <text id="2">{message}</text>
+        </binding>
+    </visual>
+</toast>
+"@
+
+$xml = New-Object Windows.Data.Xml.Dom.XmlDocument
+$xml.LoadXml($template)
+$toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
+[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("EPLAN Extractor").Show($toast)
+'''
+
+# Skip allocating a console for powershell.exe (the flag only exists on Windows)
+_CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
+def _spawn(cmd: List[str], **kwargs) -> None:
+    """Start a notifier process without pipes and without waiting for it."""
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs
+    )
+
+
+def _ps_toast_text(text: str) -> str:
+    """Escape text for the toast XML inside a double-quoted PowerShell here-string."""
+    text = _xml_escape(text, {'"': "&quot;"})
+    return text.replace("`", "``").replace("$", "`$")
+
 
 class NotificationManager:
     """Cross-platform desktop notification manager."""
 
     _enabled: bool = True
+    # Platform backend, picked from _SYSTEM on first notify()
+    _handler: Optional[Callable[[str, str, Optional[str], int], bool]] = None
+    # Shared win10toast notifier; set when win10toast turns out to be missing
+    _toaster = None
+    _toaster_import_failed: bool = False
+    # Single worker that shows async notifications in submission order
+    _executor: Optional[ThreadPoolExecutor] = None
 
     @classmethod
     def set_enabled(cls, enabled: bool) -> None:
@@ -48,15 +102,16 @@ class NotificationManager:
         if not cls._enabled:
             return False
 
-        system = platform.system().lower()
+        handler = cls._handler
+        if handler is None:
+            dispatch = {
+                "windows": cls._notify_windows,
+                "darwin": cls._notify_macos,
+            }
+            handler = cls._handler = dispatch.get(_SYSTEM, cls._notify_linux)  # Linux
 
         try:
-            if system == "windows":
-                return cls._notify_windows(title, message, icon, timeout)
-            elif system == "darwin":
-                return cls._notify_macos(title, message, icon)
-            else:  # Linux
-                return cls._notify_linux(title, message, icon, timeout)
+            return handler(title, message, icon, timeout)
         except Exception:
             return False
 
@@ -69,12 +124,9 @@ class NotificationManager:
         timeout: int = 5000
     ) -> None:
         """Show notification asynchronously."""
-        thread = threading.Thread(
-            target=cls.notify,
-            args=(title, message, icon, timeout),
-            daemon=True
-        )
-        thread.start()
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notify")
+        cls._executor.submit(cls.notify, title, message, icon, timeout)
 
     @classmethod
     def _notify_windows(
@@ -85,49 +137,40 @@ class NotificationManager:
         timeout: int
     ) -> bool:
         """Windows notification using Windows Toast."""
-        try:
-            # Try using win10toast if available
-            from win10toast import ToastNotifier
-            toaster = ToastNotifier()
-            toaster.show_toast(
-                title,
-                message,
-                icon_path=icon,
-                duration=timeout // 1000,
-                threaded=True
-            )
-            return True
-        except ImportError:
-            pass
+        # Try using win10toast if available; the notifier (a COM object plus
+        # a hidden window) is built once and reused for every toast
+        if cls._toaster is None and not cls._toaster_import_failed:
+            try:
+                from win10toast import ToastNotifier
+                cls._toaster = ToastNotifier()
+            except ImportError:
+                cls._toaster_import_failed = True
+
+        if cls._toaster is not None:
+            # Show the toast on this thread: with threaded=True win10toast
+            # returns False and drops the toast while another one is still
+            # visible. notify_async already runs this on the notify worker.
+            try:
+                if cls._toaster.show_toast(
+                    title,
+                    message,
+                    icon_path=icon,
+                    duration=timeout // 1000,
+                    threaded=False
+                ):
+                    return True
+            except Exception:
+                pass
 
         try:
-            # Fallback to PowerShell
-            ps_script = f'''
-            [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-            [Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
-
-            $template = @"
-            <toast>
-                <visual>
-                    <binding template="ToastText02">
-                        <text id="1">{title}</text>
-                        <text id="2">{message}</text>
-                    </binding>
-                </visual>
-            </toast>
-"@
-
-            $xml = New-Object Windows.Data.Xml.Dom.XmlDocument
-            $xml.LoadXml($template)
-            $toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
-            [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("EPLAN Extractor").Show($toast)
-            '''
-
-            subprocess.run(
-                ["powershell", "-Command", ps_script],
-                capture_output=True,
-                timeout=5
+            # Fallback to PowerShell. Escaping keeps quotes, $ and markup in
+            # project names from breaking the script.
+            ps_script = _PS_TOAST_SCRIPT.format(
+                title=_ps_toast_text(title),
+                message=_ps_toast_text(message)
             )
+
+            _spawn(["powershell", "-Command", ps_script], creationflags=_CREATE_NO_WINDOW)
             return True
         except Exception:
             return False
@@ -137,16 +180,13 @@ class NotificationManager:
         cls,
         title: str,
         message: str,
-        icon: Optional[str]
+        icon: Optional[str],
+        timeout: int
     ) -> bool:
         """macOS notification using osascript."""
         try:
             script = f'display notification "{message}" with title "{title}"'
-            subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                timeout=5
-            )
+            _spawn(["osascript", "-e", script])
             return True
         except Exception:
             return False
@@ -168,7 +208,7 @@ class NotificationManager:
 
             cmd.extend(["-t", str(timeout)])
 
-            subprocess.run(cmd, capture_output=True, timeout=5)
+            _spawn(cmd)
             return True
         except Exception:
             return False
@@ -1,23 +1,66 @@
 """
 Retry decorator with exponential backoff for network operations.
+
+Covers what the extractor needs without a third-party retry library:
+jittered delays, fail-fast exception classes, cancellable waits and an
+optional circuit breaker. Works on both plain functions and coroutine
+functions; the latter back off with asyncio.sleep so the event loop keeps
+running.
 """
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import random
+import threading
 import time
+from concurrent.futures import CancelledError
 from functools import wraps
-from typing import Any, Callable, Optional, Tuple, TypeVar
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
 
-from ..constants import MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY, T
+from ..constants import MAX_RETRIES, RETRY_BASE_DELAY, RETRY_JITTER, RETRY_MAX_DELAY, T
 from .logging import get_logger
 
 
+# How often the async backoff checks its cancel event
+CANCEL_POLL_INTERVAL = 0.1
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a function whose circuit breaker is open."""
+
+
+async def _wait_event_async(event: threading.Event, timeout: float) -> bool:
+    """
+    Wait up to ``timeout`` seconds for ``event`` without blocking the loop.
+
+    Returns:
+        True as soon as the event is set, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while not event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(remaining, CANCEL_POLL_INTERVAL))
+    return True
+
+
 def retry_with_backoff(
     max_retries: int = MAX_RETRIES,
     base_delay: float = RETRY_BASE_DELAY,
     max_delay: float = RETRY_MAX_DELAY,
     exceptions: Tuple[type, ...] = (Exception,),
-    on_retry: Optional[Callable[[Exception, int], None]] = None
+    jitter: float = RETRY_JITTER,
+    non_retryable: Tuple[type, ...] = (),
+    cancel_event: Optional[
+        Union[threading.Event, Callable[..., Optional[threading.Event]]]
+    ] = None,
+    on_retry: Optional[Callable[[Exception, int], None]] = None,
+    circuit_threshold: Optional[int] = None,
+    circuit_cooldown: float = 60.0,
+    _sleep: Callable[[float], None] = time.sleep
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator for retrying functions with exponential backoff.
@@ -27,40 +70,158 @@ def retry_with_backoff(
         base_delay: Initial delay between retries in seconds
         max_delay: Maximum delay between retries in seconds
         exceptions: Tuple of exception types to catch and retry
+        jitter: Fraction of each delay that is randomized (0 = fixed delays,
+            1 = full jitter), so concurrent callers don't retry in lockstep
+        non_retryable: Exception types that are re-raised immediately, even
+            if they also match ``exceptions`` (e.g. permanent failures)
+        cancel_event: Event that aborts the backoff wait with CancelledError
+            when set, or a callable that receives the wrapped call's
+            arguments and returns that event (e.g. ``lambda self, *a, **k:
+            self.stop_event`` for methods)
         on_retry: Optional callback called on each retry with (exception, attempt)
+        circuit_threshold: After this many consecutive calls exhaust their
+            retries, further calls raise CircuitOpenError without running
+            until the cooldown passes (None disables the breaker)
+        circuit_cooldown: Seconds the circuit stays open before it turns
+            half-open: exactly one trial call is let through and every other
+            call keeps raising CircuitOpenError until that trial finishes.
+            A successful trial closes the circuit, a failed one reopens it.
+        _sleep: Sleep function for the backoff when no cancel_event is
+            given; tests replace it to skip real waits
 
     Returns:
-        Decorated function with retry logic
+        Decorated function with retry logic. Its ``retry_delays`` attribute
+        holds the un-jittered delay before each retry.
     """
+    # The schedule only depends on the decorator arguments
+    delays = tuple(min(base_delay * (1 << i), max_delay) for i in range(max_retries))
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> T:
+        # Shared by every call of this function: consecutive exhausted calls,
+        # when the circuit last opened and whether a half-open trial is running
+        circuit = {"failures": 0, "opened_at": 0.0, "trial": False}
+        circuit_lock = threading.Lock()
+
+        def check_circuit() -> bool:
+            """Raise if the circuit rejects the call; True if it is the half-open trial."""
+            if circuit_threshold is None:
+                return False
+            with circuit_lock:
+                if circuit["failures"] < circuit_threshold:
+                    return False
+                if time.monotonic() - circuit["opened_at"] < circuit_cooldown:
+                    raise CircuitOpenError(
+                        f"{func.__name__} failed {circuit['failures']} times in a row; "
+                        f"not retrying for {circuit_cooldown:.0f}s"
+                    )
+                if circuit["trial"]:
+                    raise CircuitOpenError(
+                        f"{func.__name__} is half-open; waiting for the trial call"
+                    )
+                circuit["trial"] = True
+                return True
+
+        def end_trial() -> None:
+            # Also runs when the trial raised something record_result never
+            # saw (non-retryable error, cancellation), so the next caller
+            # can try again instead of the circuit staying shut
+            with circuit_lock:
+                circuit["trial"] = False
+
+        def record_result(succeeded: bool) -> None:
+            if circuit_threshold is None:
+                return
+            with circuit_lock:
+                if succeeded:
+                    circuit["failures"] = 0
+                else:
+                    circuit["failures"] += 1
+                    circuit["opened_at"] = time.monotonic()
+
+        def resolve_event(args: Tuple[Any, ...], kwargs: dict) -> Optional[threading.Event]:
+            if cancel_event is None or isinstance(cancel_event, threading.Event):
+                return cancel_event
+            return cancel_event(*args, **kwargs)
+
+        def next_delay(e: Exception, attempt: int) -> Optional[float]:
+            """Handle a failed attempt; returns the backoff delay, or None to re-raise."""
+            if isinstance(e, non_retryable):
+                return None
+            # Looked up on failure only; successful calls never need it
             logger = get_logger()
-            last_exception: Optional[Exception] = None
 
-            for attempt in range(max_retries + 1):
+            if attempt >= max_retries:
+                logger.error(
+                    "All %d attempts failed for %s", max_retries + 1, func.__name__
+                )
+                record_result(False)
+                return None
+
+            delay = delays[attempt] * (1 - jitter + random.random() * jitter)
+            logger.warning(
+                "Attempt %d/%d failed: %s. Retrying in %.1fs...",
+                attempt + 1, max_retries + 1, e, delay
+            )
+
+            if on_retry:
+                on_retry(e, attempt)
+            return delay
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                trial = check_circuit()
                 try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
+                    for attempt in range(max_retries + 1):
+                        try:
+                            result = await func(*args, **kwargs)
+                            record_result(True)
+                            return result
+                        except exceptions as e:
+                            delay = next_delay(e, attempt)
+                            if delay is None:
+                                raise
+
+                        # Event.wait would block the loop; poll it between short sleeps
+                        event = resolve_event(args, kwargs)
+                        if event is None:
+                            await asyncio.sleep(delay)
+                        elif await _wait_event_async(event, delay):
+                            raise CancelledError(f"{func.__name__} cancelled during retry")
 
-                    if attempt < max_retries:
-                        delay = min(base_delay * (2 ** attempt), max_delay)
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. "
-                            f"Retrying in {delay:.1f}s..."
-                        )
+                    raise AssertionError("unreachable")
+                finally:
+                    if trial:
+                        end_trial()
 
-                        if on_retry:
-                            on_retry(e, attempt)
+            async_wrapper.retry_delays = delays  # type: ignore[attr-defined]
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            trial = check_circuit()
+            try:
+                for attempt in range(max_retries + 1):
+                    try:
+                        result = func(*args, **kwargs)
+                        record_result(True)
+                        return result
+                    except exceptions as e:
+                        delay = next_delay(e, attempt)
+                        if delay is None:
+                            raise
 
-                        time.sleep(delay)
-                    else:
-                        logger.error(
-                            f"All {max_retries + 1} attempts failed for {func.__name__}"
-                        )
+                    event = resolve_event(args, kwargs)
+                    if event is None:
+                        _sleep(delay)
+                    elif event.wait(delay):
+                        raise CancelledError(f"{func.__name__} cancelled during retry")
 
-            raise last_exception  # type: ignore
+                raise AssertionError("unreachable")
+            finally:
+                if trial:
+                    end_trial()
 
+        wrapper.retry_delays = delays  # type: ignore[attr-defined]
         return wrapper
     return decorator
@@ -28,15 +28,15 @@ Version: 2.2.0
 from __future__ import annotations
 
 import argparse
-import getpass
+import itertools
 import os
 import sys
 import time
-import unittest
-from datetime import datetime
 from typing import Optional
 
-from eplan_extractor.constants import VERSION, BASE_URL
+# Everything else is imported inside the command that needs it, so --help,
+# --version, --history and friends start without unittest, Selenium or Tk
+from eplan_extractor.constants import VERSION
 
 
 def run_tests() -> bool:
@@ -46,24 +46,18 @@ def run_tests() -> bool:
     Returns:
         True if all tests passed
     """
+    import unittest
+
     print(f"\nEPLAN Extractor v{VERSION} - Running Unit Tests\n")
     print("=" * 60)
 
-    # Import test modules
-    from tests.test_cache import TestCacheManager
-    from tests.test_config import TestConfigManager
-    from tests.test_retry import TestRetryDecorator
-    from tests.test_patterns import TestAddressRegex
-
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestCacheManager))
-    suite.addTests(loader.loadTestsFromTestCase(TestConfigManager))
-    suite.addTests(loader.loadTestsFromTestCase(TestRetryDecorator))
-    suite.addTests(loader.loadTestsFromTestCase(TestAddressRegex))
+    # Collect every tests/test_*.py module
+    root_dir = os.path.dirname(os.path.abspath(__file__))
+    suite = unittest.TestLoader().discover(
+        start_dir=os.path.join(root_dir, "tests"),
+        pattern="test_*.py",
+        top_level_dir=root_dir
+    )
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -103,6 +97,10 @@ def run_cli_extraction(
     Returns:
         True if extraction succeeded
     """
+    import getpass
+    from datetime import datetime
+
+    from eplan_extractor.constants import BASE_URL
     from eplan_extractor.core.cache import CacheManager
     from eplan_extractor.core.config import ConfigManager, ExtractionRecord
     from eplan_extractor.core.extractor import SeleniumEPlanExtractor
@@ -174,13 +172,13 @@ def run_cli_extraction(
             raise Exception("Failed to switch to list view")
 
         print("[4/4] Extracting variables...")
-        if not extractor.extract_variables():
+        stats = extractor.extract_variables()
+        if stats is None:
             raise Exception("Extraction failed")
 
-        # Get statistics
-        pages_extracted = getattr(extractor, '_pages_processed', 0)
-        variables_found = getattr(extractor, '_variables_found', 0)
-        output_file = f"{project} IO-List.xlsx"
+        pages_extracted = stats.pages
+        variables_found = stats.variables
+        output_file = stats.output_file
 
         duration = time.time() - start_time
         print(f"\nExtraction completed in {duration:.1f} seconds")
@@ -225,19 +223,20 @@ def show_history() -> None:
     from eplan_extractor.core.config import ConfigManager
 
     config_manager = ConfigManager()
-    history = config_manager.get_history()
+    history = config_manager.iter_history(limit=20)  # Show last 20
+    first = next(history, None)
 
     print(f"\nEPLAN Extractor v{VERSION} - Extraction History")
     print("=" * 80)
 
-    if not history:
+    if first is None:
         print("No extraction history found.")
         return
 
     print(f"{'Date':<20} {'Project':<20} {'Duration':<10} {'Variables':<10} {'Status':<10}")
     print("-" * 80)
 
-    for record in history[:20]:  # Show last 20
+    for record in itertools.chain((first,), history):
         date = record.timestamp[:19].replace("T", " ") if record.timestamp else "Unknown"
         duration = f"{record.duration_seconds:.1f}s"
         status = "OK" if record.success else "FAILED"
@@ -306,8 +305,8 @@ def check_for_updates() -> None:
         print(f"Error checking for updates: {e}")
 
 
-def main() -> None:
-    """Main entry point for the application."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description=f"EPLAN eVIEW Text Extractor v{VERSION}",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -427,15 +426,20 @@ Examples:
         help="Enable debug mode"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    """Main entry point for the application."""
+    args = _build_parser().parse_args()
 
     # Handle --debug flag
     if args.debug:
         import eplan_extractor.constants as constants
         constants.DEBUG = True
 
-    # Set language
-    if args.lang:
+    # Set language; English is the default, so skip loading i18n for it
+    if args.lang != "en":
         from eplan_extractor.utils.i18n import I18n
         I18n.set_language(args.lang)
 
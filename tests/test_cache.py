@@ -4,6 +4,7 @@ Tests for the CacheManager class.
 
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from eplan_extractor.core.cache import CacheManager
 
@@ -47,6 +48,20 @@ class TestCacheManager(unittest.TestCase):
 
         self.assertIsNone(self.cache.get("TEST001", "Page1"))
 
+    def test_clear_all(self) -> None:
+        """Test that clearing everything counts every entry and saves once."""
+        self.cache.set("TEST001", "Page1", {"key": "value"})
+        self.cache.set("TEST002", "Page1", {"key": "value"})
+
+        with mock.patch.object(
+            self.cache, "_save_cache", wraps=self.cache._save_cache
+        ) as save:
+            count = self.cache.clear()
+
+        self.assertEqual(count, 2)
+        self.assertEqual(save.call_count, 1)
+        self.assertIsNone(self.cache.get("TEST002", "Page1"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,8 @@
 Tests for the ConfigManager class.
 """
 
+import json
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -40,6 +42,21 @@ class TestConfigManager(unittest.TestCase):
         decrypted = manager.decrypt_password(encrypted)
         self.assertEqual(decrypted, password)
 
+    def test_iter_history_limit(self) -> None:
+        """Test that iter_history yields the newest records up to the limit."""
+        entries = [{"project": f"P{i}", "timestamp": "", "success": True} for i in range(5)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = ConfigManager()
+            manager.HISTORY_FILE = str(Path(tmp) / "history.json")
+            Path(manager.HISTORY_FILE).write_text(json.dumps(entries, indent=2))
+
+            projects = [record.project for record in manager.iter_history(limit=3)]
+            self.assertEqual(projects, ["P0", "P1", "P2"])
+
+            projects = [record.project for record in manager.iter_history()]
+            self.assertEqual(projects, ["P0", "P1", "P2", "P3", "P4"])
+
 
 if __name__ == "__main__":
     unittest.main()
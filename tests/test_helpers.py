@@ -0,0 +1,53 @@
+"""
+Tests for the utility helper functions.
+"""
+
+import unittest
+
+from eplan_extractor.utils.helpers import normalize_whitespace
+
+
+def _reference(text: str) -> str:
+    """Split into lines and double-space phrases the straightforward way."""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return "\n".join(chunk for chunk in chunks if chunk)
+
+
+class TestNormalizeWhitespace(unittest.TestCase):
+    """Tests for normalize_whitespace."""
+
+    CASES = [
+        ("", ""),
+        ("   ", ""),
+        ("single", "single"),
+        ("one two", "one two"),
+        ("  leading and trailing  ", "leading and trailing"),
+        ("a\nb", "a\nb"),
+        ("a\r\nb\r\n", "a\nb"),
+        ("a\rb", "a\nb"),
+        ("a\n\n\nb", "a\nb"),
+        ("a\n   \n\tb", "a\nb"),
+        ("a  b", "a\nb"),
+        ("a     b", "a\nb"),
+        ("a \t b", "a \t b"),
+        ("\t head\n tail\t", "head\ntail"),
+        ("x  \r\n  y  z", "x\ny\nz"),
+        ("para\u2028next\x0cpage", "para\nnext\npage"),
+    ]
+
+    def test_table(self) -> None:
+        """Test that each input normalizes to the expected lines."""
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(normalize_whitespace(text), expected)
+
+    def test_matches_reference(self) -> None:
+        """Test that the result matches splitting lines and double spaces."""
+        for text, _ in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(normalize_whitespace(text), _reference(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
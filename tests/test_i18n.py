@@ -0,0 +1,84 @@
+"""
+Tests for the I18n translation manager.
+"""
+
+import unittest
+
+from eplan_extractor.utils.i18n import I18n, t
+
+
+class TestI18n(unittest.TestCase):
+    """Tests for the I18n translation manager."""
+
+    def setUp(self) -> None:
+        """Start every test in English."""
+        I18n.set_language("en")
+
+    def tearDown(self) -> None:
+        """Restore the default language."""
+        I18n.set_language("en")
+
+    def test_switch_language(self) -> None:
+        """Test that switching languages changes and restores a known key."""
+        self.assertEqual(t("app_title"), "EPLAN eVIEW Extractor")
+
+        I18n.set_language("de")
+        self.assertEqual(I18n.get_language(), "de")
+        self.assertEqual(t("app_title"), "EPLAN eVIEW Extraktor")
+
+        I18n.set_language("en")
+        self.assertEqual(t("app_title"), "EPLAN eVIEW Extractor")
+
+    def test_missing_key_falls_back_to_key(self) -> None:
+        """Test that unknown keys are returned unchanged in every language."""
+        self.assertEqual(t("no_such_key"), "no_such_key")
+
+        I18n.set_language("de")
+        self.assertEqual(t("no_such_key"), "no_such_key")
+
+    def test_unknown_language_is_ignored(self) -> None:
+        """Test that an unsupported language code keeps the current language."""
+        I18n.set_language("xx")
+        self.assertEqual(I18n.get_language(), "en")
+
+    def test_same_language_does_not_notify(self) -> None:
+        """Test that setting the active language again skips the observers."""
+        calls = []
+
+        def observer() -> None:
+            calls.append(I18n.get_language())
+
+        I18n.add_observer(observer)
+        try:
+            I18n.set_language("en")
+            I18n.set_language("de")
+            I18n.set_language("de")
+        finally:
+            I18n.remove_observer(observer)
+
+        self.assertEqual(calls, ["de"])
+
+    def test_formatted_cache_distinguishes_arguments(self) -> None:
+        """Test that a warm format cache still returns text for each argument."""
+        one = t("cache_cleared_msg", count=1)
+        self.assertEqual(one, "Successfully cleared 1 cache entries.")
+        self.assertEqual(t("cache_cleared_msg", count=1), one)
+
+        self.assertEqual(t("cache_cleared_msg", count=2), "Successfully cleared 2 cache entries.")
+        self.assertEqual(t("cache_cleared_msg", count=1.0), "Successfully cleared 1.0 cache entries.")
+        self.assertEqual(t("cache_cleared_msg", count=True), "Successfully cleared True cache entries.")
+        self.assertEqual(t("cache_cleared_msg", count=1), one)
+
+    def test_formatted_cache_follows_language(self) -> None:
+        """Test that cached formatted text is not reused after switching language."""
+        english = t("cache_cleared_msg", count=3)
+
+        I18n.set_language("de")
+        self.assertNotEqual(t("cache_cleared_msg", count=3), english)
+
+        I18n.set_language("en")
+        self.assertEqual(t("cache_cleared_msg", count=3), english)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for the file logger.
+"""
+
+import unittest
+
+from eplan_extractor.utils.logging import LogLevel, get_logger
+
+
+class _Counted:
+    """Argument that records how often it is formatted."""
+
+    def __init__(self) -> None:
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return "counted"
+
+
+class TestFileLogger(unittest.TestCase):
+    """Tests for the FileLogger level threshold."""
+
+    def setUp(self) -> None:
+        """Collect logged messages through a callback."""
+        self.logger = get_logger()
+        self.messages = []
+        self._min_rank = self.logger._min_rank
+        self.logger.add_callback(self._collect)
+
+    def tearDown(self) -> None:
+        """Remove the callback and restore the previous threshold."""
+        self.logger.remove_callback(self._collect)
+        self.logger._min_rank = self._min_rank
+        self.logger.flush()
+
+    def _collect(self, message: str, level: str) -> None:
+        self.messages.append((level, message))
+
+    def test_arguments_are_formatted(self) -> None:
+        """Test that %-style arguments are formatted into kept messages."""
+        self.logger.set_level(LogLevel.INFO)
+        self.logger.warning("Attempt %d/%d failed", 1, 3)
+        self.assertEqual(self.messages, [(LogLevel.WARNING, "Attempt 1/3 failed")])
+
+    def test_dropped_messages_are_not_formatted(self) -> None:
+        """Test that messages below the threshold skip formatting entirely."""
+        self.logger.set_level(LogLevel.ERROR)
+        arg = _Counted()
+
+        self.logger.debug("debug %s", arg)
+        self.logger.info("info %s", arg)
+        self.logger.success("success %s", arg)
+        self.logger.warning("warning %s", arg)
+        self.logger.log("plain", LogLevel.INFO)
+        self.assertEqual(arg.formatted, 0)
+        self.assertEqual(self.messages, [])
+
+        self.logger.error("error %s", arg)
+        self.assertEqual(arg.formatted, 1)
+        self.assertEqual(self.messages, [(LogLevel.ERROR, "error counted")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+Tests for the desktop notification manager.
+"""
+
+import unittest
+
+from eplan_extractor.utils.notifications import NotificationManager
+
+
+class TestNotificationManager(unittest.TestCase):
+    """Tests for NotificationManager."""
+
+    def setUp(self) -> None:
+        """Disable notifications so nothing is shown or spawned."""
+        self._was_enabled = NotificationManager.is_enabled()
+        NotificationManager.set_enabled(False)
+
+    def tearDown(self) -> None:
+        """Restore the enabled flag."""
+        NotificationManager.set_enabled(self._was_enabled)
+
+    def test_disabled_notify_returns_false(self) -> None:
+        """Test that notify does nothing while notifications are disabled."""
+        self.assertFalse(NotificationManager.notify("title", "message"))
+
+    def test_notify_async_reuses_single_worker(self) -> None:
+        """Test that notify_async submits every call to the same worker."""
+        NotificationManager.notify_async("first", "message")
+        executor = NotificationManager._executor
+        self.assertIsNotNone(executor)
+
+        for i in range(5):
+            NotificationManager.notify_async("title", f"message {i}")
+
+        self.assertIs(NotificationManager._executor, executor)
+        # Wait for the queued calls; they run in submission order on one thread
+        executor.submit(lambda: None).result(timeout=5)
+        self.assertEqual(executor._max_workers, 1)
+        self.assertEqual(len(executor._threads), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
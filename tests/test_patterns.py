@@ -2,18 +2,18 @@
 Tests for the address pattern regex.
 """
 
-import re
 import unittest
 
-from eplan_extractor.core.extractor import SeleniumEPlanExtractor
-
 
 class TestAddressRegex(unittest.TestCase):
     """Tests for the address pattern regex."""
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.pattern = re.compile(SeleniumEPlanExtractor.ADDRESS_PATTERN)
+        # Imported here so collecting the suite doesn't load Selenium
+        from eplan_extractor.core.extractor import SeleniumEPlanExtractor
+
+        self.pattern = SeleniumEPlanExtractor.ADDRESS_PATTERN_RE
 
     def test_valid_addresses(self) -> None:
         """Test that valid addresses are matched."""
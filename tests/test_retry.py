@@ -2,9 +2,12 @@
 Tests for the retry_with_backoff decorator.
 """
 
+import threading
+import time
 import unittest
+from concurrent.futures import CancelledError
 
-from eplan_extractor.utils.retry import retry_with_backoff
+from eplan_extractor.utils.retry import CircuitOpenError, retry_with_backoff
 
 
 class TestRetryDecorator(unittest.TestCase):
@@ -14,7 +17,7 @@ class TestRetryDecorator(unittest.TestCase):
         """Test that successful calls return immediately."""
         call_count = 0
 
-        @retry_with_backoff(max_retries=3, base_delay=0.01)
+        @retry_with_backoff(max_retries=3, base_delay=0.01, jitter=0.0)
         def always_succeeds() -> str:
             nonlocal call_count
             call_count += 1
@@ -27,8 +30,11 @@ class TestRetryDecorator(unittest.TestCase):
     def test_retry_on_failure(self) -> None:
         """Test that failures trigger retries."""
         call_count = 0
+        delays = []
 
-        @retry_with_backoff(max_retries=3, base_delay=0.01)
+        @retry_with_backoff(
+            max_retries=3, base_delay=0.01, jitter=0.0, _sleep=delays.append
+        )
         def fails_twice() -> str:
             nonlocal call_count
             call_count += 1
@@ -39,15 +45,158 @@ class TestRetryDecorator(unittest.TestCase):
         result = fails_twice()
         self.assertEqual(result, "success")
         self.assertEqual(call_count, 3)
+        self.assertEqual(delays, [0.01, 0.02])
 
     def test_max_retries_exceeded(self) -> None:
         """Test that max retries raises exception."""
-        @retry_with_backoff(max_retries=2, base_delay=0.01)
+        delays = []
+
+        @retry_with_backoff(
+            max_retries=2, base_delay=0.01, jitter=0.0, _sleep=delays.append
+        )
         def always_fails() -> None:
             raise ValueError("Permanent error")
 
         with self.assertRaises(ValueError):
             always_fails()
+        self.assertEqual(delays, [0.01, 0.02])
+
+    def test_non_retryable_raises_immediately(self) -> None:
+        """Test that non-retryable exceptions skip the remaining attempts."""
+        call_count = 0
+
+        @retry_with_backoff(
+            max_retries=3, base_delay=0.01, jitter=0.0, non_retryable=(ValueError,)
+        )
+        def fails_permanently() -> None:
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Permanent error")
+
+        with self.assertRaises(ValueError):
+            fails_permanently()
+        self.assertEqual(call_count, 1)
+
+    def test_circuit_opens_after_threshold(self) -> None:
+        """Test that an open circuit fails fast without calling the function."""
+        call_count = 0
+
+        @retry_with_backoff(
+            max_retries=1, base_delay=0.01, jitter=0.0,
+            circuit_threshold=2, circuit_cooldown=60.0, _sleep=lambda delay: None
+        )
+        def always_fails() -> None:
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Upstream down")
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                always_fails()
+        self.assertEqual(call_count, 4)
+
+        with self.assertRaises(CircuitOpenError):
+            always_fails()
+        self.assertEqual(call_count, 4)
+
+    def test_half_open_lets_one_trial_through(self) -> None:
+        """Test that after the cooldown only one trial call runs at a time."""
+        fail = True
+        trial_started = threading.Event()
+        release_trial = threading.Event()
+        results = []
+
+        @retry_with_backoff(
+            max_retries=0, circuit_threshold=1, circuit_cooldown=0.0,
+            _sleep=lambda delay: None
+        )
+        def flaky() -> str:
+            if fail:
+                raise ValueError("Upstream down")
+            trial_started.set()
+            release_trial.wait(5)
+            return "ok"
+
+        with self.assertRaises(ValueError):
+            flaky()
+
+        # Cooldown elapsed: the first caller becomes the trial
+        fail = False
+        trial = threading.Thread(target=lambda: results.append(flaky()))
+        trial.start()
+        self.assertTrue(trial_started.wait(5))
+
+        # Every other caller is rejected while the trial is running
+        for _ in range(3):
+            with self.assertRaises(CircuitOpenError):
+                flaky()
+
+        release_trial.set()
+        trial.join(5)
+        self.assertEqual(results, ["ok"])
+
+        # The successful trial closed the circuit
+        self.assertEqual(flaky(), "ok")
+
+    def test_failed_trial_reopens_circuit(self) -> None:
+        """Test that a failed half-open trial opens the circuit again."""
+        call_count = 0
+
+        @retry_with_backoff(
+            max_retries=0, circuit_threshold=1, circuit_cooldown=0.2,
+            _sleep=lambda delay: None
+        )
+        def always_fails() -> None:
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Upstream down")
+
+        with self.assertRaises(ValueError):
+            always_fails()
+
+        # Let the cooldown pass, then fail the trial
+        time.sleep(0.25)
+        with self.assertRaises(ValueError):
+            always_fails()
+        self.assertEqual(call_count, 2)
+
+        with self.assertRaises(CircuitOpenError):
+            always_fails()
+        self.assertEqual(call_count, 2)
+
+
+class TestAsyncRetryDecorator(unittest.IsolatedAsyncioTestCase):
+    """Tests for retry_with_backoff applied to coroutine functions."""
+
+    async def test_async_retry(self) -> None:
+        """Test that coroutines are awaited and retried."""
+        call_count = 0
+
+        @retry_with_backoff(max_retries=3, base_delay=0.01, jitter=0.0)
+        async def fails_twice() -> str:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ValueError("Temporary error")
+            return "success"
+
+        result = await fails_twice()
+        self.assertEqual(result, "success")
+        self.assertEqual(call_count, 3)
+
+    async def test_async_cancel_skips_backoff(self) -> None:
+        """Test that a set cancel event aborts the backoff without waiting it out."""
+        cancel = threading.Event()
+        cancel.set()
+
+        @retry_with_backoff(max_retries=3, base_delay=30.0, jitter=0.0, cancel_event=cancel)
+        async def always_fails() -> None:
+            raise ValueError("Temporary error")
+
+        start = time.monotonic()
+        with self.assertRaises(CancelledError):
+            await always_fails()
+        self.assertLess(time.monotonic() - start, 1.0)
 
 
 if __name__ == "__main__":